@@ -9,5 +9,6 @@ Animenosekai
 
 from miko.miko import Callable, BaseDocumentation, Documentation, ConstantDocumentation
 from miko.miko import Docs, Function  # backward compatibility
+from miko.runtime import Module, walk
 from .__info__ import __version__, __license__, __author__, __copyright__  # isort:skip
 from . import static, markdown
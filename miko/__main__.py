@@ -2,6 +2,7 @@
 import argparse
 import json
 import pathlib
+import sys
 
 import miko
 from miko import static, markdown
@@ -56,7 +57,8 @@ def main(args: argparse.Namespace):
                 return element.is_private
 
         return markdown.make.make_docs(args.entry, output_dir=output_dir, file_filter=ignore_file,
-                                       element_filter=ignore_element, safe=args.safe)
+                                       element_filter=ignore_element, safe=args.safe,
+                                       allow_import=args.allow_import)
 
     if args.action == "overview":
         if not args.module:
@@ -82,7 +84,8 @@ def main(args: argparse.Namespace):
 
         rendered = markdown.make.make_module_docs(args.module, output_file=output_file,
                                                   element_filter=ignore_element,
-                                                  safe=args.safe)
+                                                  safe=args.safe,
+                                                  allow_import=args.allow_import)
         if not args.output:
             return print(rendered)
         output_file.write_text(rendered)
@@ -106,7 +109,8 @@ def main(args: argparse.Namespace):
                                        indent=args.indent,
                                        noself=args.noself,
                                        flag_prefix=args.flag_prefix,
-                                       safe=args.safe)
+                                       safe=args.safe,
+                                       allow_import=args.allow_import)
 
         if args.minify:
             stringified = json.dumps(
@@ -130,16 +134,25 @@ def main(args: argparse.Namespace):
         return info_results
 
     if args.raw:
-        clean_results = miko.Documentation(source_code,
+        documentation = miko.Documentation(source_code,
                                            flag_prefix=args.flag_prefix,
-                                           noself=args.noself).dumps(indent=args.indent)
+                                           noself=args.noself)
+        # Streaming the docstring instead of building it in memory
+        if args.output and pathlib.Path(args.output).is_file():
+            with open(args.output, "w", encoding="utf-8") as f:
+                documentation.dump(f, indent=args.indent)
+        else:
+            documentation.dump(sys.stdout, indent=args.indent)
+            print()
+        return None
     else:
         clean_results = static.clean(source_code,
                                      indent=args.indent,
                                      noself=args.noself,
                                      flag_prefix=args.flag_prefix,
                                      use_black=args.use_black,
-                                     safe=args.safe)
+                                     safe=args.safe,
+                                     allow_import=args.allow_import)
 
     if args.output and pathlib.Path(args.output).is_file():
         with open(args.output, "w", encoding="utf-8") as f:
@@ -168,6 +181,8 @@ def entry():
                             default="!", help='The prefix for the docstring flags. (default: "!")')
         parser.add_argument("--safe", action='store_true', required=False,
                             help='If the annotations and exceptions should be loaded safely (without loading the modules) (default: False)')
+        parser.add_argument("--allow-import", action='store_true', required=False,
+                            help='If the modules can be imported to load the annotations and exceptions, when not in safe mode (default: False)')
         parser.add_argument("--output", "-o", action='store', type=str,
                             required=False, default=None, help='The file to output the result to. If not provided, `miko` will use STDOUT.')
         parser.add_argument("input", action='store', type=str, default=None,
@@ -192,6 +207,8 @@ def entry():
                             help="If the private objects should be included in the documentation")
         parser.add_argument("--safe", action='store_true', required=False,
                             help='If the annotations and exceptions should be loaded safely (without loading the modules) (default: False)')
+        parser.add_argument("--allow-import", action='store_true', required=False,
+                            help='If the modules can be imported to load the annotations and exceptions, when not in safe mode (default: False)')
 
     parser_docs = subparser.add_parser("docs",
                                        help="Generate the documentation for the files loaded by the entry file")
@@ -20,11 +20,13 @@ def make_docs(entry_point: pathlib.Path,
                                            bool] = lambda x: False,
               element_filter: typing.Callable[[
                   static.Element], bool] = PrivateElement,
-              safe: bool = False):
+              safe: bool = False,
+              allow_import: bool = False):
     """
     Makes the documentation for every file loaded by the entry point
 
     Note: An entry point could be for example the __init__.py file of a library
+    Note: The modules are only imported when not `safe` and `allow_import` is set
     """
     entry_point = pathlib.Path(entry_point).resolve()
     if entry_point.is_dir():
@@ -38,7 +40,7 @@ def make_docs(entry_point: pathlib.Path,
     imports = static.get_imports(entry_point, entry_point.parent)
 
     make_module_docs(entry_point, output_dir /
-                     entry_point.with_suffix(".md"), safe=safe)
+                     entry_point.with_suffix(".md"), safe=safe, allow_import=allow_import)
 
     for imp in imports:
         if file_filter(imp.file):
@@ -50,7 +52,8 @@ def make_docs(entry_point: pathlib.Path,
 
         try:
             rendered = make_module_docs(imp.file, output_file,
-                                        element_filter=element_filter, safe=safe)
+                                        element_filter=element_filter, safe=safe,
+                                        allow_import=allow_import)
         except Exception as exc:
             print("Warning: Failed to make docs for", imp.file)
             print(exc)
@@ -60,13 +63,15 @@ def make_docs(entry_point: pathlib.Path,
 
 
 def make_module_docs(source_file: pathlib.Path, output_file: pathlib.Path,
-                     element_filter: typing.Callable[[static.Element], bool] = PrivateElement, safe: bool = False):
+                     element_filter: typing.Callable[[static.Element], bool] = PrivateElement, safe: bool = False,
+                     allow_import: bool = False):
     """Makes the documentation for a module"""
     source_file = pathlib.Path(source_file).resolve()
     output_file = pathlib.Path(output_file).resolve()
     with open(source_file) as f:
         r = ast.parse(f.read())
-    elements = static.get_elements(r, filename=str(source_file), safe=safe)
+    elements = static.get_elements(r, filename=str(source_file), safe=safe, statements_only=True,
+                                   allow_import=allow_import)
     for element in elements:
         if isinstance(element.node, ast.Module):
             output_file.parent.mkdir(parents=True, exist_ok=True)
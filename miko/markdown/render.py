@@ -281,7 +281,7 @@ def parameters(parameters: parsers.parameters.Parameters):
         additions = []
         if parameter.deprecated:
             additions.append("Note: This parameter is **deprecated**")
-        if parameter.default and (not is_empty(parameter.default)):
+        if not is_empty(parameter.default):
             additions.append(f"Default Value: `{parameter.default}`")
         elif parameter.optional:
             additions.append("This value is **optional**")
@@ -2,18 +2,55 @@
 miko.py
 Contains the main code for the Miko documentation style
 """
+import collections
+import concurrent.futures
 import dataclasses
 import inspect
+import io
+import itertools
+import os
 import types
 import typing
+import weakref
 
 from miko import parsers
+from miko.utils.cache import LRUCache
+from miko.utils.writer import StrippedWriter, Writable
+
+
+class _CallableField:
+    """
+    A lazily computed field of `Callable`
+
+    The value is computed on first access and stored in the `_fields` of the instance,
+    which can be shared between the instances describing the same callable.
+    """
+
+    def __init__(self, func: typing.Callable[["Callable"], typing.Any]) -> None:
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: typing.Optional["Callable"], owner: typing.Optional[type] = None):
+        if instance is None:
+            return self
+        fields = instance._fields
+        try:
+            return fields[self.name]
+        except KeyError:
+            value = fields[self.name] = self.func(instance)
+            return value
 
 
 class Callable:
     """
     Retrieves information on a given function
 
+    Note: The information is only retrieved when first accessed
+
     Raises
     ------
     TypeError
@@ -30,6 +67,9 @@ class Callable:
         name: str
         "The original name of the callable"
 
+    _instances: "weakref.WeakKeyDictionary[typing.Callable, typing.Dict[str, typing.Any]]" = weakref.WeakKeyDictionary()
+    "The fields computed for each callable, see `Callable.of`"
+
     def __init__(self, func: typing.Callable) -> None:
         """
         Parameters
@@ -40,22 +80,67 @@ class Callable:
         "The callable object"
         self.name = self.callable.__name__
         "The name of the callable"
-        self.signature = inspect.signature(func)
-        "The signature of the callable"
-        self.docs = Documentation(
+        self._fields: typing.Dict[str, typing.Any] = {}
+
+    @classmethod
+    def of(cls, func: typing.Callable) -> "Callable":
+        """
+        Returns the information on the given callable,
+        reusing what was already computed for it
+
+        The computed fields are weakly cached, and are
+        dropped once the callable is garbage collected.
+
+        Parameters
+        ----------
+        func: () -> Any
+
+        Returns
+        -------
+        Callable
+        """
+        result = cls(func)
+        # Bound methods are created on each attribute access,
+        # but the fields only depend on the underlying function
+        if inspect.ismethod(func):
+            key, flavor = func.__func__, "method"
+        else:
+            key, flavor = func, "callable"
+        try:
+            fields = cls._instances.setdefault(key, {})
+        except TypeError:
+            # Not hashable or can't be weakly referenced
+            return result
+        result._fields = fields.setdefault(flavor, {})
+        return result
+
+    @_CallableField
+    def signature(self) -> inspect.Signature:
+        """The signature of the callable"""
+        return inspect.signature(self.callable)
+
+    @_CallableField
+    def docs(self) -> "Documentation":
+        """The documentation of the callable"""
+        return Documentation.cached(
             docstring=self.callable.__doc__ if self.callable.__doc__ else "",
             signature=self.signature,
             noself=inspect.ismethod(self.callable),
         )
-        "The documentation of the callable"
-        self.code = Callable.get_code(self.callable)
-        "The code object of the callable"
-        self.source = self.Source(
+
+    @_CallableField
+    def code(self) -> types.CodeType:
+        """The code object of the callable"""
+        return Callable.get_code(self.callable)
+
+    @_CallableField
+    def source(self) -> "Callable.Source":
+        """The source of the callable"""
+        return self.Source(
             filename=self.code.co_filename,
             line=self.code.co_firstlineno,
             name=self.code.co_name,
         )
-        "The source of the callable"
 
     @property
     def local_variables(self) -> typing.Tuple[str, ...]:
@@ -141,7 +226,7 @@ class Callable:
         """Returns whether the callable is a class or not"""
         return inspect.isclass(self.callable)
 
-    @property
+    @_CallableField
     def source_code(self):
         """Returns the source code for the callable"""
         return inspect.getsource(self.callable)
@@ -159,6 +244,143 @@ class Callable:
 Function = Callable
 
 
+@dataclasses.dataclass(frozen=True)
+class SectionTable:
+    """
+    The section dispatch table of a documentation class
+
+    This is compiled once per class, when the class is created,
+    and shared by all of its instances.
+
+    Note: The table is immutable, which makes it safe to read from multiple threads.
+    To register new sections or aliases, subclass the documentation class (and the parsers).
+    """
+
+    parsers: typing.Mapping[str, typing.Type[parsers.parser.Parser]]
+    "The parser type for each attribute, in declaration order"
+    blocks: typing.Mapping[str, str]
+    "The attribute for each normalized block section name"
+    inline: typing.Mapping[str, str]
+    "The attribute for each normalized inline section name"
+    flags: typing.Mapping[str, str]
+    "The attribute for each normalized flag name"
+    block_attributes: typing.Tuple[str, ...] = ()
+    "The attributes holding a block parser, in declaration order"
+    inline_attributes: typing.Tuple[str, ...] = ()
+    "The attributes holding an inline parser, in declaration order"
+    flag_attributes: typing.Tuple[str, ...] = ()
+    "The attributes holding a flag parser, in declaration order"
+
+    @classmethod
+    def compile(cls, documentation: typing.Type["BaseDocumentation"]) -> "SectionTable":
+        """
+        Compiles the dispatch table for the given documentation class
+
+        Parameters
+        ----------
+        documentation: type[BaseDocumentation]
+            The documentation class to compile the table for.
+            The annotations of the whole MRO are taken into account,
+            the ones on subclasses overriding the ones on their parents.
+
+        Returns
+        -------
+        SectionTable
+        """
+        annotations: typing.Dict[str, typing.Any] = {}
+        for klass in reversed(documentation.__mro__):
+            annotations.update(vars(klass).get("__annotations__", {}))
+
+        found: typing.Dict[str, typing.Type[parsers.parser.Parser]] = {}
+        mappings: typing.Dict[typing.Type[parsers.parser.Parser], typing.Dict[str, str]] = {
+            parsers.map.MapParser: {},
+            parsers.inline.InlineParser: {},
+            parsers.flag.FlagParser: {},
+        }
+        attributes: typing.Dict[typing.Type[parsers.parser.Parser], typing.List[str]] = {
+            kind: [] for kind in mappings
+        }
+        for attr, annotation in annotations.items():
+            if not isinstance(annotation, type):
+                continue
+            for kind, mapping in mappings.items():
+                if issubclass(annotation, kind):
+                    for name in annotation.names:
+                        mapping[documentation._normalize_name(name)] = attr
+                    attributes[kind].append(attr)
+                    found[attr] = annotation
+
+        return cls(
+            parsers=types.MappingProxyType(found),
+            blocks=types.MappingProxyType(mappings[parsers.map.MapParser]),
+            inline=types.MappingProxyType(mappings[parsers.inline.InlineParser]),
+            flags=types.MappingProxyType(mappings[parsers.flag.FlagParser]),
+            block_attributes=tuple(attributes[parsers.map.MapParser]),
+            inline_attributes=tuple(attributes[parsers.inline.InlineParser]),
+            flag_attributes=tuple(attributes[parsers.flag.FlagParser]),
+        )
+
+    def section(self, name: str) -> typing.Optional[str]:
+        """
+        Returns the attribute handling the given normalized section name
+
+        Parameters
+        ----------
+        name: str
+            The normalized name of the section
+
+        Returns
+        -------
+        str
+            The attribute name
+        None
+            If no parser is registered for this section
+        """
+        attr = self.blocks.get(name, None)
+        if attr is None:
+            attr = self.inline.get(name, None)
+        return attr
+
+
+def _fingerprint(value: typing.Any) -> typing.Hashable:
+    """
+    Returns a hashable key representing the given value
+
+    Parameters
+    ----------
+    value: Any
+
+    Returns
+    -------
+    Hashable
+    """
+    if isinstance(value, inspect.Signature):
+        return (
+            tuple((parameter.name, parameter.kind,
+                   _fingerprint(parameter.annotation),
+                   _fingerprint(parameter.default))
+                  for parameter in value.parameters.values()),
+            _fingerprint(value.return_annotation)
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_fingerprint(element) for element in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (type(value), repr(value))
+    # The type is kept to avoid mixing up `1`, `1.0` and `True`
+    return (type(value), value)
+
+
+DOCUMENTATION_CACHE: LRUCache[typing.Hashable, "BaseDocumentation"] = LRUCache(maxsize=1024,
+                                                                               enabled=False)
+"""
+The cache used by `BaseDocumentation.cached`
+
+Note: It is disabled by default, set `DOCUMENTATION_CACHE.enabled` to True to use it
+"""
+
+
 class BaseDocumentation:
     """The base docstring parser"""
 
@@ -166,106 +388,248 @@ class BaseDocumentation:
     "Original text"
     description: str
     "The description"
+    sections: typing.ClassVar[SectionTable]
+    "The section dispatch table, compiled once for each class"
+    _frozen: bool = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.sections = SectionTable.compile(cls)
 
-    def __init__(self, docstring: str, flag_prefix: str = "!", **kwargs) -> None:
+    def __init__(self, docstring: str, flag_prefix: str = "!", lazy: bool = False, **kwargs) -> None:
         """
         Parameters
         ----------
         docstring: str
         flag_prefix: str, default = !
+        lazy: bool, default = False
+            If the sections should only be parsed when their attribute is first accessed.
+            The section boundaries and the description are still computed right away.
         kwargs
         """
-        self.__annotations__ = (
-            self.__annotations__ if hasattr(self, "__annotations__") else {}
-        )
-        "The different type annotations for the class"
         self.extra_arguments = kwargs
         "The extra arguments passed with the docstring parser"
         self.flag_prefix = str(flag_prefix)
-        block_map: typing.Dict[str, str] = {}
-        inline_map: typing.Dict[str, str] = {}
-        flag_map: typing.Dict[str, str] = {}
-        for attr, annotation in self.__annotations__.items():
-            for mapping, parser in [
-                (block_map, parsers.map.MapParser),
-                (inline_map, parsers.inline.InlineParser),
-                (flag_map, parsers.flag.FlagParser),
-            ]:
-                if issubclass(annotation, parser):
-                    for name in annotation.names:
-                        name = self._normalize_name(name)
-                        mapping[name] = attr
-                    setattr(self, attr, annotation(**self.extra_arguments))
+        self.lazy = bool(lazy)
+        "If the sections are parsed on first access"
+        sections = self.sections
         self.original = inspect.cleandoc(str(docstring or ""))
         description = []
-        # Handling the different sections
-        # Example:
-        # Section 1
-        # ---------
-        # Do something
-        #
-        # Section 2
-        # ---------
-        # Do another thing
-        # Between "Do something" and "Section 2", there are two newline characters
-        for section in self.original.split("\n\n"):
-            # Between "Section 1" and the content,
-            # there is a newline character and at least 3 hyphens
-            name, _, body = section.partition("\n---")
-            # Nothing describing the paragraph
-            # Example:
-            #
-            # Section 1
-            # ---------
-            # (no content)
-            if not body:
-                # The section should be considered as a description element
-                description.append(name)  # name would be the content here
-                continue
-            # Getting the parser
-            name = self._normalize_name(name)
-            attr = block_map.get(name, None)
-            if attr is None:
-                attr = inline_map.get(name, None)
-            # If there is no parser associated with the paragraph name
-            if attr is None:
-                # Reconstruct the content and add it to the description body
-                description.append("\n---".join((name, body)))
-                continue
-            # Removing the extra hyphens and the newline character
-            content = body.lstrip("-").lstrip("\n")
-            # Block parser
-            current = getattr(self, attr)
-            if isinstance(current, parsers.map.MapParser):
-                current.extend(content)
-            if isinstance(current, parsers.inline.InlineParser):
-                current.append(content)
-        # Not added to the description because parsed blocks
-        # are not description content
-        for line in description.copy():
-            line = str(line).strip()
-            if line.startswith(self.flag_prefix):
-                flag = line.removeprefix(self.flag_prefix)
-                flag = self._normalize_name(flag)
-                flag_attr = flag_map.get(flag, None)
-                if flag_attr:
-                    getattr(self, flag_attr).set_flag()
-                    description.remove(line)
+        # The tokens to feed to each parser, indexed by attribute
+        pending: typing.Dict[str, typing.List[parsers.tokenizer.Token]] = {
+            attr: [] for attr in sections.parsers
+        }
+        # Flags and inline sections are only applied once
+        # every section has been parsed
+        deferred: typing.List[typing.Tuple[str, parsers.tokenizer.Token]] = []
+        for token in parsers.tokenizer.tokenize(self.original,
+                                                flag_prefix=self.flag_prefix):
+            if isinstance(token, parsers.tokenizer.Section):
+                attr = sections.section(self._normalize_name(token.name))
+                # If there is no parser associated with the paragraph name
+                if attr is None:
+                    description.append(token.text)
                     continue
-            start, _, content = str(line).partition(":")
-            start = self._normalize_name(start)
-            content = content.strip()
-            if not content:
+                pending[attr].append(token)
                 continue
-            # Inline parser
-            attr = inline_map.get(start, None)
-            if attr is None:
-                continue
-            getattr(self, attr).append(content)
-            # Not part of the description anymore
-            description.remove(line)
+
+            if isinstance(token, parsers.tokenizer.Flag):
+                attr = sections.flags.get(self._normalize_name(token.name), None)
+                if attr:
+                    deferred.append((attr, token))
+                    continue
+                token = token.fallback or parsers.tokenizer.Description(token.lines)
+
+            if isinstance(token, parsers.tokenizer.Inline):
+                attr = sections.inline.get(self._normalize_name(token.name), None)
+                if attr:
+                    deferred.append((attr, token))
+                    continue
+
+            # Nothing describing the paragraph
+            description.append(token.text)
+
+        for attr, token in deferred:
+            pending[attr].append(token)
+        self._pending = pending
         self.description = "\n".join(description)
 
+        if not self.lazy:
+            for attr in sections.parsers:
+                self._load(attr)
+            # Every section is loaded
+            self._pending = {}
+
+    def _load(self, attr: str) -> parsers.parser.Parser:
+        """
+        Builds the parser for the given attribute and feeds it its sections
+
+        Parameters
+        ----------
+        attr: str
+            The attribute of the parser
+
+        Returns
+        -------
+        Parser
+            The populated parser, which is also set on the instance
+        """
+        current = self.sections.parsers[attr](**self.extra_arguments)
+        # The tokens are kept, as they might be shared with copies of the documentation.
+        # The loaded sections are the ones set on the instance
+        for token in self._pending.get(attr, ()):
+            if isinstance(token, parsers.tokenizer.Section):
+                if isinstance(current, parsers.map.MapParser):
+                    current.extend(token.content)
+                if isinstance(current, parsers.inline.InlineParser):
+                    current.append("\n".join(token.content))
+            elif isinstance(token, parsers.tokenizer.Flag):
+                current.set_flag()
+            elif isinstance(token, parsers.tokenizer.Inline):
+                current.append(token.content)
+        # Concurrent loads all end up with the same parser
+        return vars(self).setdefault(attr, current)
+
+    def freeze(self) -> None:
+        """
+        Parses every section and prevents any further modification of the documentation
+
+        Note: This is used for the documentations shared by `cached`
+        """
+        for attr in self.sections.parsers:
+            getattr(self, attr).freeze()
+        self._frozen = True
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        if self._frozen:
+            raise TypeError(f"This {self.__class__.__name__} is frozen and can't be modified")
+        super().__setattr__(name, value)
+
+    def __getattr__(self, attr: str):
+        # Only called when the attribute is missing,
+        # which happens for the sections which are not loaded yet
+        pending = self.__dict__.get("_pending", None)
+        if pending is None or attr not in self.sections.parsers:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+        return self._load(attr)
+
+    @classmethod
+    def cached(cls, docstring: str, flag_prefix: str = "!", **kwargs):
+        """
+        Returns the documentation for the given docstring,
+        reusing a previously parsed one when `DOCUMENTATION_CACHE` is enabled
+
+        The cache is keyed on the class, the cleaned docstring, the flag prefix
+        and the extra arguments (signature, noself, raised...), except `filename`.
+
+        Note: The cached documentation is shared between the callers, so it is frozen (see `freeze`)
+        and modifying it raises a `TypeError`
+
+        Parameters
+        ----------
+        docstring: str
+        flag_prefix: str, default = !
+        kwargs
+            The extra arguments passed to the documentation
+
+        Returns
+        -------
+        BaseDocumentation
+        """
+        if not DOCUMENTATION_CACHE.enabled:
+            return cls(docstring, flag_prefix=flag_prefix, **kwargs)
+
+        kwargs["lazy"] = False  # shared results are fully parsed
+        try:
+            key = (cls, inspect.cleandoc(str(docstring or "")), str(flag_prefix),
+                   tuple(sorted((name, _fingerprint(value))
+                                for name, value in kwargs.items()
+                                if name not in ("filename", "lazy"))))
+            hash(key)
+        except TypeError:
+            return cls(docstring, flag_prefix=flag_prefix, **kwargs)
+
+        def parse() -> BaseDocumentation:
+            documentation = cls(docstring, flag_prefix=flag_prefix, **kwargs)
+            documentation.freeze()
+            return documentation
+
+        return DOCUMENTATION_CACHE.get_or_set(key, parse)
+
+    @classmethod
+    def parse_many(cls, docstrings: typing.Iterable[str],
+                   workers: typing.Optional[int] = None,
+                   chunksize: int = 1,
+                   executor: str = "process",
+                   flag_prefix: str = "!",
+                   **kwargs) -> typing.Iterator["BaseDocumentation"]:
+        """
+        Parses multiple docstrings, possibly in parallel
+
+        The docstrings are read as the results are consumed,
+        with at most two chunks per worker being parsed in advance
+
+        Parameters
+        ----------
+        docstrings: Iterable[str]
+            The docstrings to parse
+        workers: int, optional
+            The maximum number of workers, defaults to the `concurrent.futures` default
+        chunksize: int, default = 1
+            The number of docstrings sent to a worker process at once
+        executor: str, default = process
+            How to parse the docstrings: "serial", "thread" or "process"
+        flag_prefix: str, default = !
+        kwargs
+            The extra arguments passed to every documentation
+
+        Yields
+        ------
+        BaseDocumentation
+            The documentations, in the same order as the docstrings
+
+        Raises
+        ------
+        ValueError
+            If the executor is not supported
+        """
+        if executor == "serial":
+            return (cls(docstring, flag_prefix=flag_prefix, **kwargs)
+                    for docstring in docstrings)
+
+        if executor == "thread":
+            make_pool: typing.Callable[..., concurrent.futures.Executor] = concurrent.futures.ThreadPoolExecutor
+        elif executor == "process":
+            make_pool = concurrent.futures.ProcessPoolExecutor
+        else:
+            raise ValueError(f"Unsupported executor: '{executor}' "
+                             "(expected 'serial', 'thread' or 'process')")
+
+        chunksize = max(int(chunksize), 1)
+        # Only a few chunks per worker are in flight at once,
+        # the next ones being sent as the results are consumed
+        window = (workers or os.cpu_count() or 1) * 2
+
+        def results():
+            iterator = iter(docstrings)
+            chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+            pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+            pool = make_pool(max_workers=workers)
+            try:
+                for chunk in itertools.islice(chunks, window):
+                    pending.append(pool.submit(_parse_documentations, cls, chunk, flag_prefix, kwargs))
+                while pending:
+                    documentations = pending.popleft().result()
+                    for chunk in itertools.islice(chunks, 1):
+                        pending.append(pool.submit(_parse_documentations, cls, chunk, flag_prefix, kwargs))
+                    yield from documentations
+            finally:
+                # The generator might not be fully consumed
+                pool.shutdown(wait=True, cancel_futures=True)
+
+        return results()
+
     @staticmethod
     def _normalize_name(name: str) -> str:
         """
@@ -281,44 +645,43 @@ class BaseDocumentation:
         """
         return name.replace(" ", "").upper().strip()
 
-    def dumps(self, indent: int = 4):
+    def dump(self, fp: Writable, indent: int = 4) -> None:
         """
-        Returns a clean docstring
+        Writes a clean docstring to the given text stream
 
         Parameters
         ----------
+        fp: Writable
+            The text stream to write to (a file, `sys.stdout`, `io.StringIO`...)
         indent: int, default = 4
         """
-        result = ""
+        writer = StrippedWriter(fp)
+        separator = ""
         # Adding back the description if it has content
         if self.description.replace(" ", ""):
-            result += self.description
-            result += "\n\n"
-        # Adding flags
-        for attr in self.__annotations__:
-            parser = getattr(self, attr)
-            if isinstance(parser, parsers.flag.FlagParser):
-                element = parser.dumps(indent=indent)
-                if element:
-                    result += element
-                    result += "\n\n"
-        # Adding inline sections
-        for attr in self.__annotations__:
-            parser = getattr(self, attr)
-            if isinstance(parser, parsers.inline.InlineParser):
-                element = parser.dumps(indent=indent)
-                if element:
-                    result += element
-                    result += "\n\n"
-        # Adding block sections
-        for attr in self.__annotations__:
-            parser = getattr(self, attr)
-            if isinstance(parser, parsers.map.MapParser):
-                element = parser.dumps(indent=indent)
-                if element:
-                    result += element
-                    result += "\n\n"
-        return result.strip().strip("\n")
+            writer.write(self.description)
+            separator = "\n\n"
+        # Adding flags, then inline sections and block sections
+        for attr in (self.sections.flag_attributes
+                     + self.sections.inline_attributes
+                     + self.sections.block_attributes):
+            # The separator is only written if the section has some content
+            section = StrippedWriter(writer, prefix=separator)
+            getattr(self, attr).dump(section, indent=indent)
+            if section.written:
+                separator = "\n\n"
+
+    def dumps(self, indent: int = 4):
+        """
+        Returns a clean docstring
+
+        Parameters
+        ----------
+        indent: int, default = 4
+        """
+        result = io.StringIO()
+        self.dump(result, indent=indent)
+        return result.getvalue()
 
     def __repr__(self) -> str:
         """
@@ -328,9 +691,8 @@ class BaseDocumentation:
         """
         representations = [
             f"{attr}={getattr(self, attr)}"
-            for attr, annotation in self.__annotations__.items()
+            for attr in self.sections.parsers
             if getattr(self, attr)
-            and issubclass(annotation, (parsers.parser.Parser, parsers.flag.FlagParser))
         ]
         return f"{self.__class__.__name__}({', '.join(representations)})"
 
@@ -338,15 +700,20 @@ class BaseDocumentation:
     def exported(self):
         """The exported data"""
         results: typing.Dict[str, typing.Any] = {"description": self.description}
-        for attr in self.__annotations__:
-            result = getattr(self, attr)
-            if isinstance(result, parsers.parser.Parser):
-                results[attr] = result.exported
-            else:
-                results[attr] = result
+        for attr in self.sections.parsers:
+            results[attr] = getattr(self, attr).exported
         return results
 
 
+BaseDocumentation.sections = SectionTable.compile(BaseDocumentation)
+
+
+def _parse_documentations(cls: typing.Type[BaseDocumentation], docstrings: typing.List[str],
+                          flag_prefix: str, kwargs: typing.Dict[str, typing.Any]) -> typing.List[BaseDocumentation]:
+    """Parses a chunk of docstrings, used by the `BaseDocumentation.parse_many` workers"""
+    return [cls(docstring, flag_prefix=flag_prefix, **kwargs) for docstring in docstrings]
+
+
 class ConstantDocumentation(BaseDocumentation):
     """The documentation for a constant"""
 
@@ -4,5 +4,5 @@ This folder contains a list of different documentation object parser
 """
 from . import (caution, changelog, copyright, deprecated, example, flag,
                important, inline, map, notes, parameters, parser, raises,
-               references, returns, tip, warnings, yields)
+               references, returns, tip, tokenizer, warnings, yields)
 
@@ -17,39 +17,49 @@ import typing
 from miko.parsers.map import MapParser, MapElement
 
 
+def _parse_year(value: typing.Optional[str]) -> typing.Optional[int]:
+    """Returns the given year as an integer, if valid"""
+    if value is None or not value.isdecimal():
+        return None
+    return int(value)
+
+
 class License(MapElement):
     """A license in the `Copyright` section"""
-    @property
-    def license(self) -> typing.Optional[str]:
+
+    __slots__ = ()
+
+    def _derive(self) -> typing.Dict[str, typing.Any]:
+        fields = super()._derive()
+        values = fields["values"]
+        fields["license"] = None
         for option in self.options:
-            if option.startswith(("year", "from", "to")):
+            key, separator, _ = str(option).partition("=")
+            if separator and self._normalize_option(key) in ("year", "from", "to"):
                 continue
-            return option
-        return None
+            fields["license"] = option
+            break
+        year = _parse_year(values.get("year", None))
+        year_from = _parse_year(values.get("from", None))
+        year_to = _parse_year(values.get("to", None))
+        fields["year_from"] = year if year_from is None else year_from
+        fields["year_to"] = year if year_to is None else year_to
+        return fields
+
+    @property
+    def license(self) -> typing.Optional[str]:
+        """The license"""
+        return self._fields["license"]
 
     @property
     def year_from(self) -> typing.Optional[int]:
-        for option in self.options:
-            if not option.startswith("from"):
-                continue
-            return int(option.partition("=")[2])
-        for option in self.options:
-            if not option.startswith("year"):
-                continue
-            return int(option.partition("=")[2])
-        return None
+        """The first year of the copyright"""
+        return self._fields["year_from"]
 
     @property
     def year_to(self) -> typing.Optional[int]:
-        for option in self.options:
-            if not option.startswith("to"):
-                continue
-            return int(option.partition("=")[2])
-        for option in self.options:
-            if not option.startswith("year"):
-                continue
-            return int(option.partition("=")[2])
-        return None
+        """The last year of the copyright"""
+        return self._fields["year_to"]
 
     def render_options(self) -> str:
         results = []
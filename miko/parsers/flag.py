@@ -17,9 +17,11 @@ Example
 ...     (description)
 ...     """
 '''
+import io
 import typing
 
 from miko.parsers.parser import Parser
+from miko.utils.writer import StrippedWriter, Writable
 
 
 class FlagParser(Parser):
@@ -29,12 +31,17 @@ class FlagParser(Parser):
 
     def set_flag(self):
         """Sets the flag"""
+        self._ensure_mutable()
         self.elements.append(True)
 
-    def dumps(self, indent: int = 4, prefix: str = "!"):
+    def dump(self, fp: Writable, indent: int = 4, prefix: str = "!") -> None:
         if self.elements:
-            return f"{prefix} {self.name}"
-        return ""
+            StrippedWriter(fp).write(f"{prefix} {self.name}")
+
+    def dumps(self, indent: int = 4, prefix: str = "!"):
+        result = io.StringIO()
+        self.dump(result, indent=indent, prefix=prefix)
+        return result.getvalue()
 
     @property
     def flag(self):
@@ -23,6 +23,7 @@ def func():
     """
 '''
 from miko.parsers.parser import Parser
+from miko.utils.writer import StrippedWriter, Writable
 
 
 class InlineParser(Parser[str]):
@@ -32,29 +33,23 @@ class InlineParser(Parser[str]):
 
     def append(self, content: str):
         """Extends the current """
+        self._ensure_mutable()
         self.elements.append(content)
 
-    def dumps(self, indent: int = 4):
-        one_liners = []
+    def dump(self, fp: Writable, indent: int = 4) -> None:
+        writer = StrippedWriter(fp)
         multi_liners = []
         for element in self.elements:
             if "\n" in element:
                 multi_liners.append(element)
             else:
-                one_liners.append(element)
-
-        result = ""
-
-        for element in one_liners:
-            result += f"{self.name}: {element}\n\n"
+                writer.write(f"{self.name}: {element}\n\n")
 
         for element in multi_liners:
-            result += f"{self.name}\n"
-            result += f"{'-' * len(self.name)}\n"
-            result += element
-            result += "\n\n"
-
-        return result.strip().strip("\n")
+            writer.write(f"{self.name}\n")
+            writer.write(f"{'-' * len(self.name)}\n")
+            writer.write(element)
+            writer.write("\n\n")
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({len(self.elements)} elements)"
@@ -15,17 +15,17 @@ Example
 ...         element2 description
 ...     """
 '''
+import io
+import types
 import typing
 
 from miko.parsers.parser import Parser, Element
 from miko.utils.caster import split_options
+from miko.utils.writer import StrippedWriter, Writable
 
 
 class MapElement(Element):
     """An item in the map"""
-    name: str
-    """The name for the map item"""
-
     options: typing.Set[str]
     """
     The options for the element
@@ -37,20 +37,88 @@ class MapElement(Element):
         (content)
     """
 
+    __slots__ = ("_name", "options", "_derived")
+
+    _renames: typing.ClassVar[int] = 0
+    """The number of times an element has been renamed, for the parsers to know when their index is stale"""
+
     def __init__(self, name: str,
                  options: typing.Optional[typing.Iterable[str]] = None, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.name = str(name)
+        self._name = str(name)
         self.options = set(options or [])
+        self._derived: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+    @property
+    def name(self) -> str:
+        """The name for the map item"""
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._ensure_mutable()
+        value = str(value)
+        if value != self._name:
+            MapElement._renames += 1
+        self._name = value
 
     def _normalize_option(self, option: str):
         return str(option).strip().lower()
 
+    def _derive(self) -> typing.Dict[str, typing.Any]:
+        """
+        Computes the fields derived from the options
+
+        Note: Subclasses can extend the returned dictionary, to parse their own options once.
+        The options are already split in `_options` and `values` (see `MapElement.values`).
+        It is cached until the element changes (see `invalidate`)
+        """
+        results = set()
+        values = {}
+        for option in self.options:
+            normalized = self._normalize_option(option)
+            if normalized:
+                results.add(normalized)
+            key, separator, value = str(option).partition("=")
+            if separator:
+                values.setdefault(self._normalize_option(key), value.strip())
+        return {"_options": frozenset(results), "values": values}
+
     @property
-    def _options(self) -> typing.Set[str]:
+    def _fields(self) -> typing.Dict[str, typing.Any]:
+        """The cached fields derived from the options"""
+        if self._derived is None:
+            self._derived = self._derive()
+        return self._derived
+
+    def invalidate(self) -> None:
+        """
+        Clears the cached fields derived from the options
+
+        Note: This needs to be called after modifying `options` or `name` directly
+        """
+        self._ensure_mutable()
+        self._derived = None
+
+    @property
+    def _options(self) -> typing.FrozenSet[str]:
         """An internal set of processed options"""
-        results = {self._normalize_option(opt) for opt in self.options}
-        return {res for res in results if res}
+        return self._fields["_options"]
+
+    @property
+    def values(self) -> typing.Mapping[str, str]:
+        """
+        The values of the `key = value` options, by normalized key (read-only)
+
+        Note: The first value is kept when a key is given multiple times
+
+        Example
+        -------
+        element1: year = 2020
+                  ^^^^   ^^^^
+                  (key)  (value)
+        """
+        return types.MappingProxyType(self._fields["values"])
 
     def extend_options(self, options: typing.Iterable[str]):
         """
@@ -60,32 +128,60 @@ class MapElement(Element):
         ----------
         options: Iterable[str]
             Options to add to the options
+
+        Raises
+        ------
+        TypeError
+            If the element is frozen
         """
+        self._ensure_mutable()
         self.options.update([opt for opt in options if opt])
+        self.invalidate()
+
+    def freeze(self) -> None:
+        # The derived fields can't be cached once frozen
+        self._fields
+        self.options = frozenset(self.options)
+        super().freeze()
 
     def render_options(self) -> str:
         """Renders the options"""
         return ", ".join(self.options)
 
-    def dumps(self, indent: int = 4) -> str:
+    def dump(self, fp: Writable, indent: int = 4) -> None:
         """
-        Renders the element
+        Renders the element to the given text stream
 
         Parameters
         ----------
+        fp: Writable
+            The text stream to write to
         indent: int, default = 4
             The indentation level
         """
-        result = self.name
+        fp.write(self.name)
         options = self.render_options()
         if options:
-            result += f": {options}"
-        result += "\n"
+            fp.write(f": {options}")
+        fp.write("\n")
+        padding = " " * indent
         for line in self.body.splitlines():
-            result += " " * indent
-            result += line
-            result += "\n"
-        return result
+            fp.write(padding)
+            fp.write(line)
+            fp.write("\n")
+
+    def dumps(self, indent: int = 4) -> str:
+        """
+        Renders the element
+
+        Parameters
+        ----------
+        indent: int, default = 4
+            The indentation level
+        """
+        result = io.StringIO()
+        self.dump(result, indent=indent)
+        return result.getvalue()
 
     @property
     def exported(self):
@@ -105,68 +201,329 @@ class MapParser(Parser[T]):
     # element: typing.Type[T] = MapElement
     # elements: typing.List[T]
 
-    def extend(self, content: str) -> None:
+    # The mutations need to go through the parser to keep the index in sync
+    _forwarded = frozenset(("copy", "count", "index"))
+
+    # Class level defaults, for the instances created without `__init__` (i.e unpickled)
+    _index: typing.Dict[str, int] = {}
+    _indexed: int = -1
+    _renamed: int = -1
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._index: typing.Dict[str, int] = {}
+        """The position of the first element for each name, kept in sync with `elements`"""
+        self._indexed = 0
+        """The number of elements taken into account by the index"""
+        self._renamed = MapElement._renames
+        """The number of renamed elements when the index was built (see `MapElement._renames`)"""
+
+    def _reindex(self) -> None:
+        """Rebuilds the index from the elements"""
+        self._index = {}
+        for position, element in enumerate(self.elements):
+            self._index.setdefault(element.name, position)
+        self._indexed = len(self.elements)
+        self._renamed = MapElement._renames
+
+    def _sync(self) -> None:
+        """Rebuilds the index if the elements were added, removed or renamed without going through the parser"""
+        if self._indexed != len(self.elements) or self._renamed != MapElement._renames:
+            self._reindex()
+
+    def _position(self, key: str, exhaustive: bool = True) -> typing.Optional[int]:
+        """
+        Returns the position of the first element with the given name
+
+        Parameters
+        ----------
+        key: str
+            The name of the element
+        exhaustive: bool, default = True
+            If the elements should be searched when the name isn't indexed,
+            in case they were replaced directly in `elements`
+
+        Returns
+        -------
+        int
+            The position of the element in `elements`
+        None
+            If there is no element with this name
+        """
+        self._sync()
+        position = self._index.get(key, None)
+        if position is None:
+            if exhaustive and any(element.name == key for element in self.elements):
+                self._reindex()
+                return self._index[key]
+            return None
+        if self.elements[position].name != key:
+            # Replaced without going through the parser
+            self._reindex()
+            position = self._index.get(key, None)
+        return position
+
+    def _find(self, key: str, exhaustive: bool = True) -> typing.Optional[T]:
+        """
+        Returns the first element with the given name
+
+        Parameters
+        ----------
+        key: str
+            The name of the element
+        exhaustive: bool, default = True
+            If the elements should be searched when the name isn't indexed (see `_position`)
+
+        Returns
+        -------
+        T
+            The element
+        None
+            If there is no element with this name
+        """
+        position = self._position(key, exhaustive=exhaustive)
+        return None if position is None else self.elements[position]
+
+    def freeze(self) -> None:
+        # The index can't be rebuilt once frozen
+        self._sync()
+        super().freeze()
+
+    def _shift(self, start: int, offset: int) -> None:
+        """Moves the positions of the indexed elements from `start` by `offset`"""
+        for name, position in self._index.items():
+            if position >= start:
+                self._index[name] = position + offset
+
+    def append(self, element: T) -> None:
+        """
+        Adds the given element at the end of the elements
+
+        Parameters
+        ----------
+        element: T
+        """
+        self._ensure_mutable()
+        self._sync()
+        self.elements.append(element)
+        self._index.setdefault(element.name, len(self.elements) - 1)
+        self._indexed += 1
+
+    def insert(self, position: int, element: T) -> None:
+        """
+        Inserts the given element before the given position
+
+        Parameters
+        ----------
+        position: int
+        element: T
+        """
+        self._ensure_mutable()
+        self._sync()
+        # Normalizing the position like `list.insert`
+        position = min(max(position + len(self.elements) if position < 0 else position, 0), len(self.elements))
+        self.elements.insert(position, element)
+        self._shift(position, 1)
+        if self._index.get(element.name, position) >= position:
+            self._index[element.name] = position
+        self._indexed += 1
+
+    def pop(self, position: int = -1) -> T:
+        """
+        Removes the element at the given position
+
+        Parameters
+        ----------
+        position: int, default = -1
+
+        Returns
+        -------
+        T
+            The removed element
+
+        Raises
+        ------
+        IndexError
+            If the position is out of range
+        """
+        self._ensure_mutable()
+        self._sync()
+        if position < 0:
+            position += len(self.elements)
+        element = self.elements.pop(position)
+        self._indexed -= 1
+        self._shift(position + 1, -1)
+        if self._index.get(element.name, None) == position:
+            # The next element with the same name (if any) is now the first one
+            self._index.pop(element.name)
+            for index in range(position, len(self.elements)):
+                if self.elements[index].name == element.name:
+                    self._index[element.name] = index
+                    break
+        return element
+
+    def remove(self, element: T) -> None:
+        """
+        Removes the given element
+
+        Parameters
+        ----------
+        element: T
+
+        Raises
+        ------
+        ValueError
+            If the element is not in the parser
+        """
+        self.pop(self.elements.index(element))
+
+    def clear(self) -> None:
+        """Removes every element"""
+        self._ensure_mutable()
+        self.elements.clear()
+        self._reindex()
+
+    def sort(self, *args, **kwargs) -> None:
+        """Sorts the elements in place (see `list.sort`)"""
+        self._ensure_mutable()
+        self.elements.sort(*args, **kwargs)
+        self._reindex()
+
+    def reverse(self) -> None:
+        """Reverses the elements in place"""
+        self._ensure_mutable()
+        self.elements.reverse()
+        self._reindex()
+
+    def extend(self, content: typing.Union[str, typing.Iterable[str]]) -> None:
         """
         Parses and adds new content to the paragraph
 
         Parameters
         ----------
-        content: str
-            The content to add to the paragraph
+        content: str | Iterable[str]
+            The content to add to the paragraph,
+            or its lines (as given by the tokenizer sections)
         """
+        self._ensure_mutable()
+        if isinstance(content, str):
+            content = content.splitlines()
         current = None
-        for line in str(content).splitlines():
+        element = None
+        for line in content:
             # If the line is indented
             if line.startswith(" ") and current:
-                self[current].append_body(line)
+                element.append_body(line)
                 continue
             # If the line is not indented, we are outside of an element scope
             # element1: option1, option2
             current, _, options = line.partition(":")
             current = current.strip()
             opt = split_options(options)
-            try:
-                self[current].extend_options(opt)
-            except KeyError:
+            # The elements are only added by the parser here
+            element = self._find(current, exhaustive=False)
+            if element is None:
                 # Not declared yet
                 # We need to create a new element
-                self.elements.append(self.element(name=current, options=opt,
-                                                  **self.extra_arguments))
+                element = self.new_element(name=current, options=opt)
+                self.append(element)
+            else:
+                element.extend_options(opt)
 
-    def dumps(self, indent: int = 4) -> str:
-        result = ""
-        if self.elements:
-            result = f"{self.name}\n"
-            # a minimum of 3 hyphens
-            result += f"{'-' * max(len(self.name), 3)}\n"
+    def new_element(self, name: str,
+                    options: typing.Optional[typing.Iterable[str]] = None) -> T:
+        """
+        Creates a new element, sharing the parser's extra arguments
+
+        Note: The element is not added to the parser
+
+        Parameters
+        ----------
+        name: str
+            The name of the element
+        options: Iterable[str], optional
+            The options of the element
+
+        Returns
+        -------
+        T
+        """
+        return self.element(name=name, options=options,
+                            extra_arguments=self.extra_arguments)
 
-            for element in self.elements:
-                result += element.dumps(indent=indent)
+    def dump(self, fp: Writable, indent: int = 4) -> None:
+        if not self.elements:
+            return
+        writer = StrippedWriter(fp)
+        writer.write(f"{self.name}\n")
+        # a minimum of 3 hyphens
+        writer.write(f"{'-' * max(len(self.name), 3)}\n")
 
-        return result.strip().strip("\n")
+        for element in self.elements:
+            element.dump(writer, indent=indent)
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """
+        Returns the element with the given name, without raising if it doesn't exist
+
+        Parameters
+        ----------
+        key: str
+            The name of the element
+        default: Any, default = None
+            The value to return if there is no such element
+
+        Returns
+        -------
+        T
+            The element
+        Any
+            The default value
+        """
+        element = self._find(str(key))
+        return default if element is None else element
 
     def __getitem__(self, key: str):
         key = str(key)
-        for element in self.elements:
-            if element.name == key:
-                return element
-        raise KeyError(
-            f"The given name '{key}' does not seem to be an element")
+        element = self._find(key)
+        if element is None:
+            raise KeyError(
+                f"The given name '{key}' does not seem to be an element")
+        return element
 
     def __setitem__(self, key: str, value: MapElement):
+        self._ensure_mutable()
         key = str(key)
+        # The value might already be in the parser, renamed in place
+        current = self._position(value.name, exhaustive=False)
+        if current is not None:
+            current = next((index for index in range(current, len(self.elements))
+                            if self.elements[index] is value), None)
+        position = self._position(key)
         value.name = key
-        for index, element in enumerate(self.elements):
-            if element.name == key:
-                self.elements[index] = value
-                return
-        self.elements.append(value)
+        value.invalidate()
+        if current is not None:
+            if position is not None and position != current:
+                # Replacing the element previously named `key`
+                self.elements.pop(position)
+            self._reindex()
+        elif position is None:
+            # The value wasn't in the parser, the index is still valid
+            self._renamed = MapElement._renames
+            self.append(value)
+        else:
+            self._renamed = MapElement._renames
+            self.elements[position] = value
 
     def __delitem__(self, key: str):
-        for index, element in enumerate(self.elements):
-            if element.name == key:
-                self.elements.pop(index)
-                return
+        self._ensure_mutable()
+        position = self._position(str(key))
+        if position is None:
+            return
+        self.pop(position)
+
+    def __contains__(self, key: str):
+        return self._find(str(key)) is not None
 
     def __iter__(self):
         return iter(self.elements)
@@ -19,11 +19,14 @@ import typing
 
 from miko.parsers.map import MapElement, MapParser
 from miko.utils.caster import try_cast, try_retrieve_type, stringify
-from miko.utils.empty import Empty, is_empty
+from miko.utils.empty import EMPTY, Empty, is_empty
 
 
 class Parameter(MapElement):
     """A parameter in the `Parameters` paragraph"""
+
+    __slots__ = ()
+
     @property
     def signature(self) -> typing.Optional[inspect.Signature]:
         """The signature of the callable, if provided"""
@@ -34,10 +37,48 @@ class Parameter(MapElement):
         """The filename where the parameter is defined, if provided"""
         return self.extra_arguments.get("filename", None)
 
+    def _derive(self) -> typing.Dict[str, typing.Any]:
+        fields = super()._derive()
+        types = set()
+        default = None
+        for option in self.options:
+            opt = self._normalize_option(option)
+            if opt.startswith("default"):
+                if default is None:
+                    default = option
+                continue
+            if opt in {"optional", "required", "deprecated"}:
+                continue
+            types.update(try_retrieve_type(option, filename=self.filename))
+
+        # parameter = self.signature_parameter
+        # if parameter:
+        #     types.update(try_retrieve_type(
+        #         parameter.annotation, filename=self.filename))
+
+        fields["types"] = frozenset(types)
+        fields["deprecated"] = "deprecated" in fields["_options"]
+        # if self.signature:
+        #     param = self.signature_parameter
+        #     if param and not is_empty(param.default):
+        #         fields["optional"] = True  # it has a default value, thus is optional
+        fields["optional"] = ("optional" in fields["_options"]
+                              or any(val.startswith("default") for val in fields["_options"]))
+        if default is None:
+            fields["default"] = EMPTY
+        else:
+            _, _, content = default.partition("=")
+            fields["default"] = try_cast(content.strip(), fields["types"])
+
+        # parameter = self.signature_parameter
+        # if parameter and not is_empty(parameter.default):
+        #     fields["default"] = parameter.default
+        return fields
+
     @property
     def deprecated(self) -> bool:
         """If the parameter is considered as deprecated"""
-        return "deprecated" in self._options
+        return self._fields["deprecated"]
 
     @property
     def signature_parameter(self) -> typing.Optional[inspect.Parameter]:
@@ -50,12 +91,7 @@ class Parameter(MapElement):
     @property
     def optional(self) -> bool:
         """If the parameter is optional"""
-        # if self.signature:
-        #     param = self.signature_parameter
-        #     if param and not is_empty(param.default):
-        #         return True  # it has a default value, thus is optional
-        return ("optional" in self._options
-                or any(val.startswith("default") for val in self._options))
+        return self._fields["optional"]
 
     @property
     def default(self) -> typing.Union[str, Empty, typing.Any]:
@@ -64,35 +100,16 @@ class Parameter(MapElement):
 
         Note: This can be something other than a string if the `signature` of the callable is provided
         """
-        for opt in self.options:
-            if self._normalize_option(opt).startswith("default"):
-                _, _, content = opt.partition("=")
-                element = content.strip()
-                return try_cast(element, self.types)
-
-        # parameter = self.signature_parameter
-        # if parameter and not is_empty(parameter.default):
-        #     return parameter.default
-
-        return Empty()
+        return self._fields["default"]
 
     @property
     def types(self) -> typing.Set[typing.Union[str, type, None]]:
-        """Returns the parameter's possible types"""
-        results = set()
-
-        for option in self.options:
-            opt = self._normalize_option(option)
-            if opt.startswith("default") or opt in {"optional", "required", "deprecated"}:
-                continue
-            results.update(try_retrieve_type(option, filename=self.filename))
-
-        # parameter = self.signature_parameter
-        # if parameter:
-        #     results.update(try_retrieve_type(
-        #         parameter.annotation, filename=self.filename))
+        """
+        Returns the parameter's possible types
 
-        return results
+        Note: This is a copy of the cached types, which can be modified
+        """
+        return set(self._fields["types"])
 
     def render_options(self) -> str:
         results = []
@@ -115,15 +132,14 @@ class Parameter(MapElement):
 
     @property
     def exported(self):
-        try:
-            json.dumps(self.default)
-        except TypeError:
-            if isinstance(self.default, Empty):
-                default_value = "@miko.empty"
-            else:
-                default_value = str(self.default)
+        default_value = self.default
+        if is_empty(default_value):
+            default_value = "@miko.empty"
         else:
-            default_value = self.default
+            try:
+                json.dumps(default_value)
+            except TypeError:
+                default_value = str(default_value)
         return {
             **super().exported,
             "deprecated": self.deprecated,
@@ -145,38 +161,62 @@ class Parameters(MapParser[Parameter]):
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         if self.signature:
-            for name, parameter in self.signature.parameters.items():
-                if name == "self" and self.noself:
-                    continue
-
-                if name not in self:
-                    options = []
-                    if not is_empty(parameter.annotation):
-                        options.append(parameter.annotation)
-                    if not is_empty(parameter.default):
-                        options.append(f"default = {str(parameter.default)}")
-                    self[name] = self.element(name=name,
-                                              options=options,
-                                              **self.extra_arguments)
-                else:
-                    adding_types = []
-                    types = self[name].types
-
-                    for incoming in try_retrieve_type(parameter.annotation, filename=self.filename):
-                        if incoming not in types and stringify(incoming) not in types:
-                            adding_types.append(incoming)
-
-                    if not is_empty(parameter.default) and is_empty(self[name].default):
-                        adding_types.append(
-                            f"default = {stringify(parameter.default)}")
-
-                    self[name].extend_options(options)
+            self.merge_signature(self.signature)
+
+    def merge_signature(self, signature: inspect.Signature) -> None:
+        """
+        Reconciles the parameters with the ones from the given signature, in a single pass
+
+        The missing parameters are added in the signature order,
+        and the existing ones get the types and default value they are missing
+
+        Parameters
+        ----------
+        signature: inspect.Signature
+
+        Raises
+        ------
+        TypeError
+            If the parameters are frozen
+        """
+        self._ensure_mutable()
+        for name, parameter in signature.parameters.items():
+            if name == "self" and self.noself:
+                continue
+
+            element = self._find(name)
+            if element is None:
+                options = []
+                if not is_empty(parameter.annotation):
+                    options.append(parameter.annotation)
+                if not is_empty(parameter.default):
+                    options.append(f"default = {str(parameter.default)}")
+                self.append(self.new_element(name=name, options=options))
+                continue
+
+            adding_types = []
+            # The annotation is resolved once, and the current types are cached on the element
+            types = element.types
+            for incoming in try_retrieve_type(parameter.annotation, filename=self.filename):
+                if incoming not in types and stringify(incoming) not in types:
+                    adding_types.append(incoming)
+
+            if not is_empty(parameter.default) and is_empty(element.default):
+                adding_types.append(f"default = {stringify(parameter.default)}")
+
+            if adding_types:
+                element.extend_options(adding_types)
 
     @property
     def signature(self) -> typing.Optional[inspect.Signature]:
         """The signature of the callable, if provided"""
         return self.extra_arguments.get("signature", None)
 
+    @property
+    def filename(self) -> typing.Optional[str]:
+        """The filename where the parameters are defined, if provided"""
+        return self.extra_arguments.get("filename", None)
+
     @property
     def noself(self) -> bool:
         """If the first `self` parameter should be parsed"""
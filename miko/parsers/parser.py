@@ -1,8 +1,11 @@
 """
 Defines the base parser
 """
+import io
 import typing
 
+from miko.utils.writer import Writable
+
 
 class Element:
     """Represents an element in a docstring paragraph"""
@@ -18,11 +21,39 @@ class Element:
     """
 
     extra_arguments: typing.Dict[str, typing.Any]
-    """The extra arguments passed in with the parser"""
+    """
+    The extra arguments passed in with the parser
+
+    Note: This is shared between all of the elements of a parser
+    """
+
+    __slots__ = ("body", "extra_arguments", "_frozen")
 
-    def __init__(self, **kwargs) -> None:
+    def __init__(self, extra_arguments: typing.Optional[typing.Dict[str, typing.Any]] = None,
+                 **kwargs) -> None:
+        self._frozen = False
         self.body: str = ""
-        self.extra_arguments = kwargs
+        self.extra_arguments = kwargs if extra_arguments is None else extra_arguments
+
+    def _ensure_mutable(self) -> None:
+        """
+        Makes sure that the element can be modified
+
+        Raises
+        ------
+        TypeError
+            If the element is frozen
+        """
+        if getattr(self, "_frozen", False):
+            raise TypeError(f"This {self.__class__.__name__} is frozen and can't be modified")
+
+    def freeze(self) -> None:
+        """
+        Prevents any further modification of the element
+
+        Note: This is used for the documentations shared by `BaseDocumentation.cached`
+        """
+        self._frozen = True
 
     def append_body(self, value: str):
         """
@@ -32,7 +63,13 @@ class Element:
         ----------
         value: str
             The string to append to the body
+
+        Raises
+        ------
+        TypeError
+            If the element is frozen
         """
+        self._ensure_mutable()
         value = str(value).strip()
         if not self.body:
             self.body = value.strip("\n")
@@ -49,22 +86,76 @@ class Element:
 
 T = typing.TypeVar("T")
 
+_LIST_ATTRIBUTES = frozenset(name for name in dir(list) if not name.startswith("_"))
+"""The public attributes of the elements list, available on the parsers"""
+_MISSING = object()
+
 
 class Parser(typing.Generic[T]):
     """The base class for a parser"""
-    names: typing.List[str]
-    """The names of the section (will be normalized)"""
+    names: typing.Tuple[str, ...] = ()
+    """
+    The names of the section (will be normalized)
+
+    Note: This is frozen into a tuple when the class is created,
+    subclass the parser to add new names
+    """
     element: typing.Type[T]
     """The element type"""
     elements: typing.List[T]
-    """Elements parsed in the docstring paragraph"""
+    """Elements parsed in the docstring paragraph (a tuple once frozen)"""
     extra_arguments: typing.Dict[str, typing.Any]
     """The extra arguments passed in with the parser"""
 
+    _forwarded: typing.ClassVar[typing.FrozenSet[str]] = _LIST_ATTRIBUTES
+    """The attributes of the elements list available on the parser"""
+    _frozen: bool = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # The names are shared by every instance (and thread),
+        # they shouldn't be mutated once the class is created
+        cls.names = tuple(cls.names)
+
     def __init__(self, *args, **kwargs) -> None:
+        """
+        Parameters
+        ----------
+        args: str
+            Additional names for this parser only
+        kwargs
+            The extra arguments
+        """
         self.elements = []
         self.extra_arguments = kwargs
-        self.names.extend(args)
+        if args:
+            self.names = self.names + tuple(str(arg) for arg in args)
+
+    def _ensure_mutable(self) -> None:
+        """
+        Makes sure that the parser can be modified
+
+        Raises
+        ------
+        TypeError
+            If the parser is frozen
+        """
+        if self._frozen:
+            raise TypeError(f"This {self.__class__.__name__} is frozen and can't be modified")
+
+    def freeze(self) -> None:
+        """
+        Prevents any further modification of the parser and its elements
+
+        Note: This is used for the documentations shared by `BaseDocumentation.cached`
+        """
+        if self._frozen:
+            return
+        for element in self.elements:
+            if isinstance(element, Element):
+                element.freeze()
+        self.elements = tuple(self.elements)
+        self._frozen = True
 
     @property
     def name(self):
@@ -73,17 +164,62 @@ class Parser(typing.Generic[T]):
             return self.names[0]
         return self.__class__.__name__
 
+    def dump(self, fp: Writable, indent: int = 4) -> None:
+        """
+        Renders the docstring back to the given text stream
+
+        Parameters
+        ----------
+        fp: Writable
+            The text stream to write to
+        indent: int, default = 4
+            The indentation level
+        """
+        fp.write(self.dumps(indent=indent))
+
     def dumps(self, indent: int = 4) -> str:
         """Renders the docstring back"""
-        raise NotImplementedError(
-            "Tried to render the docstring back with a parser that wasn't fully implemented")
+        if type(self).dump is Parser.dump:
+            raise NotImplementedError(
+                "Tried to render the docstring back with a parser that wasn't fully implemented")
+        result = io.StringIO()
+        self.dump(result, indent=indent)
+        return result.getvalue()
+
+    def get(self, key: typing.Any, default: typing.Any = None) -> typing.Any:
+        """
+        Returns the given element, without raising if it doesn't exist
+
+        Parameters
+        ----------
+        key: int
+            The index of the element
+        default: Any, default = None
+            The value to return if there is no such element
+
+        Returns
+        -------
+        T
+            The element
+        Any
+            The default value
+        """
+        if isinstance(key, int) and -len(self.elements) <= key < len(self.elements):
+            return self.elements[key]
+        return default
 
     def __getattr__(self, attr: str):
-        try:
+        # Special and private names are looked up by `copy`, `pickle`, `hasattr`, etc.
+        # and `elements` might be missing while unpickling or copying
+        if attr.startswith("_") or attr == "elements":
+            raise AttributeError(attr)
+        if attr in self._forwarded:
             return getattr(self.elements, attr)
-        except AttributeError:
-            # If not an attribute, might be an element
-            return self[attr]
+        # If not an attribute, might be an element
+        element = self.get(attr, _MISSING)
+        if element is _MISSING:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute or element '{attr}'")
+        return element
 
     def __getitem__(self, key):
         return self.elements[key]
@@ -94,20 +230,11 @@ class Parser(typing.Generic[T]):
     def __len__(self):
         return len(self.elements)
 
-    def __contains__(self, element: str):
-        try:
-            _ = self[element]
-            return True
-        except KeyError:
-            return False
+    def __contains__(self, element: typing.Any):
+        return element in self.elements
 
     @property
     def exported(self):
         """The exported data"""
-        results = []
-        for element in self.elements:
-            try:
-                results.append(element.exported)
-            except AttributeError:
-                results.append(element)
-        return results
+        return [element.exported if isinstance(element, Element) else element
+                for element in self.elements]
@@ -30,8 +30,7 @@ class Raises(MapParser):
                 else:
                     name = str(exc if exc else "")
                 if name and not name in self:
-                    self[name] = self.element(name=name,
-                                              **self.extra_arguments)
+                    self[name] = self.new_element(name=name)
 
     @property
     def raised(self):
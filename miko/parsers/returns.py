@@ -35,8 +35,7 @@ class Returns(MapParser):
                 else:
                     name = str(annotation if annotation else "")
                 if name and not name in self:
-                    self[name] = self.element(name=name,
-                                              **self.extra_arguments)
+                    self[name] = self.new_element(name=name)
 
     @property
     def signature(self) -> typing.Optional[inspect.Signature]:
@@ -0,0 +1,171 @@
+'''
+Defines the docstring tokenizer
+
+The tokenizer walks a (cleaned) docstring line by line, only once,
+and emits a token for each paragraph it finds.
+
+Paragraphs are separated by an empty line, and can be:
+
+- a section, when a line starting with at least 3 hyphens follows the title
+- a flag, when the paragraph starts with the flag prefix
+- an inline section, when the paragraph looks like `Name: content`
+- a description paragraph otherwise
+
+The tokenizer does not know which sections exist,
+it is up to the consumer to decide what to do with unknown names.
+
+Example
+-------
+>>> list(tokenize("Hello\\n\\nNote: world\\n\\nReturns\\n-------\\nint"))
+[Description(lines=('Hello',)), Inline(lines=('Note: world',), name='Note', content='world'), Section(lines=('Returns', '-------', 'int'), name='Returns', content=('int',))]
+'''
+import dataclasses
+import typing
+
+
+@dataclasses.dataclass(frozen=True)
+class Token:
+    """A paragraph of the docstring"""
+    lines: typing.Tuple[str, ...]
+    """The raw lines of the paragraph"""
+
+    @property
+    def text(self) -> str:
+        """The raw text of the paragraph"""
+        return "\n".join(self.lines)
+
+
+@dataclasses.dataclass(frozen=True)
+class Description(Token):
+    """A description paragraph"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Section(Token):
+    """
+    A section paragraph
+
+    Example
+    -------
+    Section
+    -------
+    content
+    """
+    name: str = ""
+    """The raw name of the section"""
+    content: typing.Tuple[str, ...] = ()
+    """The lines of the section, without the title and the hyphens"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Inline(Token):
+    """
+    An inline section paragraph
+
+    Example
+    -------
+    Name: content
+    """
+    name: str = ""
+    """The raw name of the inline section"""
+    content: str = ""
+    """The content of the inline section"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Flag(Token):
+    """
+    A flag paragraph
+
+    Example
+    -------
+    ! FLAG
+    """
+    name: str = ""
+    """The raw name of the flag, without the prefix"""
+    fallback: typing.Optional[Token] = None
+    """The token to use if the flag is not recognized"""
+
+
+def _paragraph(lines: typing.List[str], separator: int, flag_prefix: str) -> Token:
+    """
+    Classifies a paragraph
+
+    Parameters
+    ----------
+    lines: list[str]
+        The lines of the paragraph
+    separator: int
+        The index of the first line starting with 3 hyphens, or -1
+    flag_prefix: str
+        The prefix for the flags
+    """
+    raw = tuple(lines)
+    if separator > 0:
+        rest = lines[separator].lstrip("-")
+        content = lines[separator + 1:]
+        if rest:
+            content.insert(0, rest)
+        # Removing the leading empty lines
+        start = 0
+        while start < len(content) and not content[start]:
+            start += 1
+        return Section(lines=raw,
+                       name="\n".join(lines[:separator]),
+                       content=tuple(content[start:]))
+
+    stripped = "\n".join(lines).strip()
+
+    name, _, content = stripped.partition(":")
+    content = content.strip()
+    if content:
+        token: Token = Inline(lines=raw, name=name, content=content)
+    else:
+        token = Description(lines=raw)
+
+    if stripped.startswith(flag_prefix):
+        return Flag(lines=raw,
+                    name=stripped.removeprefix(flag_prefix),
+                    fallback=token)
+
+    return token
+
+
+def tokenize(text: str, flag_prefix: str = "!") -> typing.Iterator[Token]:
+    """
+    Splits the given docstring into tokens, in a single pass
+
+    Parameters
+    ----------
+    text: str
+        The docstring, already cleaned (see `inspect.cleandoc`)
+    flag_prefix: str, default = !
+        The prefix for the flags
+
+    Yields
+    ------
+    Token
+        The paragraphs of the docstring, in order
+    """
+    lines = str(text).split("\n")
+    last = len(lines) - 1
+    current: typing.Optional[typing.List[str]] = None
+    separator = -1
+    for index, line in enumerate(lines):
+        # An empty line ends the current paragraph,
+        # the next line always starts a new one (even if it is empty)
+        if current is not None and not line and index < last:
+            yield _paragraph(current, separator, flag_prefix)
+            current = None
+            continue
+        if current is None:
+            current = [line]
+            separator = -1
+            continue
+        # Between the section name and its content,
+        # there is a line with at least 3 hyphens
+        if separator < 0 and line.startswith("---"):
+            separator = len(current)
+        current.append(line)
+    if current is not None:
+        yield _paragraph(current, separator, flag_prefix)
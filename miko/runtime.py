@@ -0,0 +1,276 @@
+"""
+Implementation of miko's runtime analysis tools
+
+This is used to document the elements of an already imported module.
+
+Example
+-------
+>>> import miko
+>>> for record in miko.walk(miko.parsers):
+...     print(record.path, record.kind)
+"""
+import dataclasses
+import functools
+import inspect
+import types
+import typing
+
+from miko.miko import Callable, ConstantDocumentation, Documentation
+from miko.utils.empty import EMPTY
+
+MODULE = "module"
+"A module"
+CLASS = "class"
+"A class"
+FUNCTION = "function"
+"A function, defined at the module level"
+METHOD = "method"
+"A function defined in a class (including class and static methods)"
+PROPERTY = "property"
+"A property defined in a class"
+CONSTANT = "constant"
+"An annotated variable, in a module or a class"
+
+
+@dataclasses.dataclass
+class Record:
+    """A documented element found when walking a module"""
+    path: str
+    """The dot path of the element"""
+    kind: str
+    """The kind of element (`module`, `class`, `function`, `method`, `property` or `constant`)"""
+    obj: typing.Any
+    """The element itself (the value for constants)"""
+    parent: typing.Optional["Record"] = None
+    """The record of the module or class where the element was found"""
+    annotation: typing.Any = EMPTY
+    """The annotation, for constants"""
+
+    @property
+    def name(self) -> str:
+        """The name of the element"""
+        return self.path.rpartition(".")[2]
+
+    @functools.cached_property
+    def signature(self) -> typing.Optional[inspect.Signature]:
+        """The signature of the element, if it has one"""
+        if self.kind in (MODULE, CONSTANT):
+            return None
+        try:
+            return Callable.of(self._callable).signature
+        except (TypeError, ValueError):
+            return None
+
+    @functools.cached_property
+    def documentation(self) -> typing.Union[Documentation, ConstantDocumentation]:
+        """The documentation of the element, parsed on first access"""
+        if self.kind == CONSTANT:
+            # The docstrings of variables are not kept at runtime
+            return ConstantDocumentation.cached("")
+        if self.kind == MODULE:
+            return ConstantDocumentation.cached(self.obj.__doc__ or "")
+        return Documentation.cached(self._callable.__doc__ or "",
+                                    signature=self.signature,
+                                    noself=self.kind in (CLASS, METHOD, PROPERTY))
+
+    @property
+    def _callable(self) -> typing.Any:
+        """The underlying callable of the element"""
+        if self.kind == PROPERTY:
+            return self.obj.fget
+        if isinstance(self.obj, classmethod) and self.parent is not None:
+            # Bound to the class, so that `cls` is not in the signature
+            try:
+                return getattr(self.parent.obj, self.name)
+            except Exception:
+                pass
+        if isinstance(self.obj, (classmethod, staticmethod)):
+            return self.obj.__func__
+        return self.obj
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.kind} {self.path})"
+
+
+def _is_private(name: str) -> bool:
+    """If the given name is considered private"""
+    return name.startswith("_")
+
+
+def _path(value: typing.Any, kind: str, default: str) -> str:
+    """
+    Returns the canonical dot path of the given element
+
+    Modules, classes and functions are often reachable from multiple places,
+    the path where they are defined is preferred over the one they are found at.
+    """
+    if kind == MODULE:
+        return value.__name__
+    if kind in (CLASS, FUNCTION):
+        module = getattr(value, "__module__", None)
+        qualname = getattr(value, "__qualname__", None)
+        if isinstance(module, str) and isinstance(qualname, str) and "<" not in qualname:
+            return f"{module}.{qualname}"
+    return default
+
+
+def walk(obj: typing.Any, include_private: bool = False,
+         visited: typing.Optional[typing.Dict[int, typing.Any]] = None) -> typing.Iterator[Record]:
+    """
+    Walks through the given module (or class) and
+    yields a record for each documentable element, lazily
+
+    Each module, class and function is only visited once,
+    even if it is reachable from multiple places (or from itself).
+    Only the elements defined within the root module package are visited.
+
+    Parameters
+    ----------
+    obj: ModuleType | type
+        The module or class to walk through
+    include_private: bool, default = False
+        If the elements with a name starting with an underscore should be included
+    visited: dict[int, Any], optional
+        The elements already visited, by id, to share between multiple walks
+
+    Yields
+    ------
+    Record
+    """
+    visited = {} if visited is None else visited
+    if inspect.ismodule(obj):
+        root = obj.__name__.partition(".")[0]
+        kind = MODULE
+    else:
+        root = str(getattr(obj, "__module__", "") or "").partition(".")[0]
+        kind = CLASS
+
+    def belongs(value: typing.Any) -> bool:
+        """If the value is defined within the root package"""
+        module = getattr(value, "__name__" if inspect.ismodule(value) else "__module__", None)
+        return isinstance(module, str) and (module == root or module.startswith(root + "."))
+
+    stack: typing.List[Record] = [Record(path=_path(obj, kind, getattr(obj, "__name__", str(obj))),
+                                         kind=kind, obj=obj)]
+    while stack:
+        record = stack.pop()
+        if id(record.obj) in visited and record.kind != CONSTANT:
+            continue
+        if record.kind != CONSTANT:
+            # Keeping a reference avoids reusing the ids of temporary objects
+            visited[id(record.obj)] = record.obj
+        yield record
+
+        if record.kind not in (MODULE, CLASS):
+            continue
+
+        children: typing.List[Record] = []
+        namespace = vars(record.obj)
+        for name, annotation in dict(namespace.get("__annotations__", {})).items():
+            if not include_private and _is_private(name):
+                continue
+            children.append(Record(path=f"{record.path}.{name}", kind=CONSTANT,
+                                   obj=namespace.get(name, EMPTY), parent=record,
+                                   annotation=annotation))
+
+        for name, value in list(namespace.items()):
+            if not include_private and _is_private(name):
+                continue
+            if record.kind == MODULE:
+                if inspect.ismodule(value):
+                    kind = MODULE
+                elif inspect.isclass(value):
+                    kind = CLASS
+                elif inspect.isfunction(value) or inspect.isbuiltin(value):
+                    kind = FUNCTION
+                else:
+                    continue
+                if not belongs(value):
+                    continue
+            else:
+                if inspect.isclass(value):
+                    kind = CLASS
+                    if not belongs(value):
+                        continue
+                elif isinstance(value, property):
+                    kind = PROPERTY
+                elif isinstance(value, (classmethod, staticmethod, types.FunctionType)):
+                    kind = METHOD
+                else:
+                    continue
+            children.append(Record(path=_path(value, kind, f"{record.path}.{name}"),
+                                   kind=kind, obj=value, parent=record))
+
+        # Reversed to visit the children in their definition order
+        stack.extend(reversed(children))
+
+
+class Module:
+    """
+    Documents an imported module at runtime
+
+    The records are computed lazily and memoized,
+    iterating multiple times over the module does not walk it again.
+
+    Example
+    -------
+    >>> module = Module(miko.parsers)
+    >>> module["miko.parsers.parameters.Parameters"].documentation
+    """
+
+    def __init__(self, module: types.ModuleType, include_private: bool = False) -> None:
+        """
+        Parameters
+        ----------
+        module: ModuleType
+            The imported module
+        include_private: bool, default = False
+            If the elements with a name starting with an underscore should be included
+        """
+        self.module = module
+        "The imported module"
+        self.include_private = bool(include_private)
+        "If the private elements are included"
+        self._records: typing.List[Record] = []
+        self._paths: typing.Dict[str, Record] = {}
+        self._walker: typing.Optional[typing.Iterator[Record]] = walk(module,
+                                                                      include_private=include_private)
+
+    def _next(self) -> typing.Optional[Record]:
+        """Walks to the next record, memoizing it"""
+        if self._walker is None:
+            return None
+        try:
+            record = next(self._walker)
+        except StopIteration:
+            self._walker = None
+            return None
+        self._records.append(record)
+        self._paths.setdefault(record.path, record)
+        return record
+
+    def __iter__(self) -> typing.Iterator[Record]:
+        index = 0
+        while True:
+            if index < len(self._records):
+                yield self._records[index]
+                index += 1
+                continue
+            if self._next() is None:
+                return
+
+    def __getitem__(self, path: str) -> Record:
+        while path not in self._paths:
+            if self._next() is None:
+                raise KeyError(f"'{path}' was not found in the module '{self.module.__name__}'")
+        return self._paths[path]
+
+    def __contains__(self, path: str) -> bool:
+        try:
+            self[path]
+        except KeyError:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.module.__name__})"
@@ -4,10 +4,13 @@ Implementation of miko's static code analysis tools
 This is used to retrieve information on the different elements of the code without having to run it.
 """
 import builtins
+import collections.abc
 import dataclasses
+import functools
 import importlib
 import importlib.util
 import inspect
+import io
 import pathlib
 import sys
 import typing
@@ -24,6 +27,8 @@ import black
 import isort
 
 import miko
+from miko.utils.cache import LRUCache
+from miko.utils.writer import IndentedWriter
 
 class Unparser(_Unparser):
     """The unparser, used by `unparse`"""
@@ -50,12 +55,35 @@ def unparse(ast_obj: ast.AST, indent: int = 4) -> str:
 
 
 
+ELEMENTS_CACHE: LRUCache[typing.Tuple[str, bool], typing.Tuple[bool, typing.Any]] = LRUCache(maxsize=2048)
+"""
+The results of `get_element`, by dot path and `builtin` flag
+
+Each entry is either `(True, element)` or `(False, (exception type, exception arguments))`,
+as the failures are remembered too (a new exception being raised each time).
+
+Note: The cache is cleared whenever `sys.modules` changes outside of `get_element`,
+which is detected from the number of modules and the last one added.
+A module removed and added back while being the last one isn't noticed.
+"""
+
+_MODULES_STATE: typing.Tuple[int, typing.Optional[str]] = (-1, None)
+"""The number of modules in `sys.modules` and the last one, the last time `get_element` resolved a dot path"""
+
+
+def _modules_state() -> typing.Tuple[int, typing.Optional[str]]:
+    """Returns a cheap signature of `sys.modules`, which keeps the modules in the order they were added"""
+    return len(sys.modules), next(reversed(sys.modules), None)
+
+
 def get_element(dot_path: str, builtin: bool = False) -> typing.Any:
     """
     Get a element from its dot path
 
     Warning: Keep in mind that the full dot path needs to be provided
 
+    Note: The results, including the failures, are cached in `ELEMENTS_CACHE`
+
     Parameters
     ----------
     dot_path: str
@@ -68,7 +96,45 @@ def get_element(dot_path: str, builtin: bool = False) -> typing.Any:
     -------
     Any
         Any element pointed by the dot path
+
+    Raises
+    ------
+    ValueError
+        If the module couldn't be found
+    AttributeError
+        If the element couldn't be found in its module
     """
+    global _MODULES_STATE
+    if _modules_state() != _MODULES_STATE:
+        # Some modules were imported (or removed) since, the previous results might be outdated
+        ELEMENTS_CACHE.clear()
+
+    def resolve() -> typing.Tuple[bool, typing.Any]:
+        try:
+            return True, _get_element(dot_path, builtin=builtin)
+        except Exception as err:
+            error = err
+        try:
+            type(error)(*error.args)
+        except Exception:
+            # Can't be created again from its arguments, so it isn't cached
+            raise error
+        # Only keeping the type and arguments, as the exception references the frames it went through
+        return False, (type(error), error.args)
+
+    try:
+        found, result = ELEMENTS_CACHE.get_or_set((dot_path, bool(builtin)), resolve)
+    finally:
+        # The modules imported while resolving should not clear the cache
+        _MODULES_STATE = _modules_state()
+    if not found:
+        error_type, arguments = result
+        raise error_type(*arguments)
+    return result
+
+
+def _get_element(dot_path: str, builtin: bool = False) -> typing.Any:
+    """Gets the element from its dot path, without caching (see `get_element`)"""
     # Might be a builtin element ?
     try:
         return getattr(builtins, dot_path)
@@ -148,7 +214,214 @@ def get_dot_path(attr: ast.expr) -> str:
     return f"{get_dot_path(attr.value)}.{attr.attr}"
 
 
-def get_value(expr: typing.Optional[ast.expr], builtin: bool = False) -> typing.Optional[typing.Any]:
+def get_module_name(file: typing.Union[str, pathlib.Path]) -> str:
+    """
+    Returns the dot path of the module defined in the given file,
+    from the packages (directories with an `__init__.py` file) it is in
+
+    Parameters
+    ----------
+    file: str | pathlib.Path
+        The file of the module
+
+    Returns
+    -------
+    str
+        The dot path of the module
+
+    Example
+    -------
+    >>> get_module_name("translatepy/translators/google.py")
+    'translatepy.translators.google'
+    """
+    file = pathlib.Path(file).resolve()
+    parts = [] if file.stem == "__init__" else [file.stem]
+    directory = file.parent
+    while (directory / "__init__.py").is_file():
+        parts.insert(0, directory.name)
+        directory = directory.parent
+    return ".".join(parts)
+
+
+def _alias_path(value: typing.Optional[ast.expr]) -> typing.Optional[str]:
+    """Returns the dot path of the value if it only names something (i.e `pathlib.Path`), None otherwise"""
+    parts = []
+    while isinstance(value, ast.Attribute):
+        parts.append(value.attr)
+        value = value.value
+    if not isinstance(value, ast.Name):
+        # "".join, foo().bar, a[0].b...
+        return None
+    parts.append(value.id)
+    return ".".join(reversed(parts))
+
+
+@dataclasses.dataclass
+class SymbolTable:
+    """
+    The names defined at the top level of a module, mapped to the dot path of what they refer to,
+    built from the imports, the classes, the functions and the assignements without running anything
+
+    Note: When a name is bound multiple times (i.e in `try...except ImportError` blocks), the first binding is kept
+
+    Example
+    -------
+    >>> symbols = SymbolTable.of(ast.parse("from translatepy import Language"), module="example")
+    >>> symbols.resolve("Language")
+    'translatepy.Language'
+    """
+    module: str = ""
+    """The dot path of the module"""
+    symbols: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
+    """The dot paths, by name"""
+    allow_import: bool = False
+    """If the modules which are not builtin can be imported when loading an element"""
+    package: typing.Optional[str] = None
+    """The package the relative imports are resolved from, the parent of `module` by default"""
+
+    @classmethod
+    def of(cls, node: ast.Module, module: str = "", package: typing.Optional[str] = None,
+           allow_import: bool = False) -> "SymbolTable":
+        """
+        Builds the symbol table of the given module
+
+        Parameters
+        ----------
+        node: ast.Module
+            The module
+        module: str, default = ""
+            The dot path of the module (see `get_module_name`)
+        package: str, optional
+            The package the relative imports are resolved from, the parent of `module` by default.
+            This is the module itself for `__init__.py` files.
+        allow_import: bool, default = False
+            If the modules which are not builtin can be imported when loading an element
+
+        Returns
+        -------
+        SymbolTable
+        """
+        table = cls(module=module, allow_import=allow_import, package=package)
+        # Only the statements run when the module is loaded
+        stack = list(reversed(node.body))
+        while stack:
+            element = stack.pop()
+            if isinstance(element, ast.Import):
+                # import x.y => x
+                # import x.y as z => z
+                for alias in element.names:
+                    if alias.asname:
+                        table._bind(alias.asname, alias.name)
+                    else:
+                        name = alias.name.partition(".")[0]
+                        table._bind(name, name)
+            elif isinstance(element, ast.ImportFrom):
+                base = table._absolute(element.module, element.level)
+                if base is None:
+                    continue
+                for alias in element.names:
+                    if alias.name != "*":
+                        table._bind(alias.asname or alias.name, f"{base}.{alias.name}")
+            elif isinstance(element, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                table._bind(element.name, table._qualify(element.name))
+            elif isinstance(element, (ast.Assign, ast.AnnAssign)):
+                targets = element.targets if isinstance(element, ast.Assign) else [element.target]
+                # An alias, like `Path = pathlib.Path`
+                alias = _alias_path(element.value)
+                target = table.resolve(alias) if alias else None
+                for name in targets:
+                    if isinstance(name, ast.Name):
+                        table._bind(name.id, target or table._qualify(name.id))
+            else:
+                # if, try, with... blocks
+                stack.extend(reversed([child for child in ast.iter_child_nodes(element)
+                                       if isinstance(child, _STATEMENTS)]))
+        return table
+
+    def _qualify(self, name: str) -> str:
+        """Returns the dot path of the given name, defined in the module"""
+        return f"{self.module}.{name}" if self.module else name
+
+    def _absolute(self, module: typing.Optional[str], level: int) -> typing.Optional[str]:
+        """Returns the absolute dot path of the imported module, or None if it can't be known"""
+        if not level:
+            return module
+        package = self.package if self.package is not None else self.module.rpartition(".")[0]
+        parts = package.split(".") if package else []
+        if level > len(parts):
+            # Going above the top level package
+            return None
+        parts = parts[:len(parts) - (level - 1)]
+        if module:
+            parts.append(module)
+        return ".".join(parts) or None
+
+    def _bind(self, name: str, dot_path: str) -> None:
+        """Binds the name to the dot path, if it isn't already"""
+        self.symbols.setdefault(name, dot_path)
+
+    def resolve(self, dot_path: str) -> str:
+        """
+        Returns the dot path the given one refers to in the module
+
+        Parameters
+        ----------
+        dot_path: str
+            A dot path, as written in the module
+
+        Returns
+        -------
+        str
+            The dot path through the imports (i.e `translatepy.Language` for `Language`),
+            the given one if its first name isn't defined in the module
+
+        Example
+        -------
+        >>> symbols.resolve("Language.english")
+        'translatepy.Language.english'
+        """
+        name, dot, rest = dot_path.partition(".")
+        try:
+            return self.symbols[name] + dot + rest
+        except KeyError:
+            return dot_path
+
+    def load(self, dot_path: str, builtin: bool = False) -> typing.Any:
+        """
+        Loads the element the given dot path refers to in the module
+
+        Only the builtin elements are loaded, unless `allow_import` is set
+
+        Parameters
+        ----------
+        dot_path: str
+            A dot path, as written in the module
+        builtin: bool, default = False
+            If the element should be a builtin one, even if `allow_import` is set
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        ValueError
+            If the module couldn't be found or can't be imported
+        AttributeError
+            If the element couldn't be found in its module
+        """
+        return get_element(self.resolve(dot_path), builtin=builtin or not self.allow_import)
+
+
+def _load_element(dot_path: str, builtin: bool = False, symbols: typing.Optional[SymbolTable] = None) -> typing.Any:
+    """Loads the element from its dot path, through the symbol table if given"""
+    if symbols is None:
+        return get_element(dot_path, builtin=builtin)
+    return symbols.load(dot_path, builtin=builtin)
+
+
+def get_value(expr: typing.Optional[ast.expr], builtin: bool = False,
+              symbols: typing.Optional[SymbolTable] = None) -> typing.Optional[typing.Any]:
     """
     Returns the correct value from the given expression
 
@@ -160,6 +433,11 @@ def get_value(expr: typing.Optional[ast.expr], builtin: bool = False) -> typing.
         If the element should be already loaded or coming from a builtin module
         to be fully loaded. Otherwise a dot path will be returned.
         See `get_element` for more information on loading arbitrary elements.
+    symbols: SymbolTable, optional
+        The names defined in the module of the expression.
+        When given, the names are resolved through the module imports to be loaded,
+        and only imported if the table allows it (see `SymbolTable.load`).
+        The names which couldn't be loaded are kept as written.
 
     Returns
     -------
@@ -184,7 +462,7 @@ def get_value(expr: typing.Optional[ast.expr], builtin: bool = False) -> typing.
         #              ~~~~~~~~~
         result = expr.id
         try:
-            return get_element(result, builtin=builtin)
+            return _load_element(result, builtin=builtin, symbols=symbols)
         except (AttributeError, ValueError):
             return result  # should not be a builtin
     if isinstance(expr, ast.Attribute):
@@ -196,7 +474,7 @@ def get_value(expr: typing.Optional[ast.expr], builtin: bool = False) -> typing.
         #              ~~~~~~~~~~~~~~~~~~~~
         result = get_dot_path(expr)
         try:
-            return get_element(result, builtin=builtin)
+            return _load_element(result, builtin=builtin, symbols=symbols)
         except (AttributeError, ValueError):
             return result  # should not be a builtin
     if isinstance(expr, ast.Subscript):
@@ -211,14 +489,14 @@ def get_value(expr: typing.Optional[ast.expr], builtin: bool = False) -> typing.
             if isinstance(expr.slice, ast.Tuple):
                 sliced_list = []
                 for element in expr.slice.elts:
-                    sliced_list.append(get_value(element, builtin=builtin))
+                    sliced_list.append(get_value(element, builtin=builtin, symbols=symbols))
                 sliced = tuple(sliced_list)
             else:
-                sliced = get_value(expr.slice, builtin=builtin)
+                sliced = get_value(expr.slice, builtin=builtin, symbols=symbols)
         except Exception:
             sliced = None
         try:
-            result_element = get_element(result, builtin=builtin)
+            result_element = _load_element(result, builtin=builtin, symbols=symbols)
             if not sliced:
                 return result_element
             try:
@@ -230,13 +508,14 @@ def get_value(expr: typing.Optional[ast.expr], builtin: bool = False) -> typing.
     if isinstance(expr, ast.List):
         results = []
         for element in expr.elts:
-            results.append(get_value(element, builtin=builtin))
+            results.append(get_value(element, builtin=builtin, symbols=symbols))
         return results
     # print(type(expr), expr)
     return None
 
 
-def signature_from_ast(node: ast.AsyncFunctionDef | ast.FunctionDef, builtin: bool = False) -> inspect.Signature:
+def signature_from_ast(node: ast.AsyncFunctionDef | ast.FunctionDef, builtin: bool = False,
+                       symbols: typing.Optional[SymbolTable] = None) -> inspect.Signature:
     """
     Computes the signature of a function from its AST
 
@@ -249,6 +528,8 @@ def signature_from_ast(node: ast.AsyncFunctionDef | ast.FunctionDef, builtin: bo
         coming from a builtin module to be fully loaded.
         Otherwise a dot path will be returned.
         See get_element for more information on loading arbitrary elements.
+    symbols: SymbolTable, optional
+        The names defined in the module of the function (see `get_value`)
 
     Returns
     -------
@@ -265,7 +546,7 @@ def signature_from_ast(node: ast.AsyncFunctionDef | ast.FunctionDef, builtin: bo
     #           ↑  ↑
     for arg in node.args.posonlyargs:
         parameters.append(inspect.Parameter(name=arg.arg,
-                          annotation=(get_value(arg.annotation, builtin=builtin)
+                          annotation=(get_value(arg.annotation, builtin=builtin, symbols=symbols)
                                       or inspect.Parameter.empty),
                           kind=inspect.Parameter.POSITIONAL_ONLY,
                           default=inspect.Parameter.empty))
@@ -288,7 +569,7 @@ def signature_from_ast(node: ast.AsyncFunctionDef | ast.FunctionDef, builtin: bo
                 default = default_wrapper.value
 
         parameters.append(inspect.Parameter(name=arg.arg,
-                                            annotation=(get_value(arg.annotation, builtin=builtin)
+                                            annotation=(get_value(arg.annotation, builtin=builtin, symbols=symbols)
                                                         or inspect.Parameter.empty),
                                             kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
                                             default=default))
@@ -312,7 +593,7 @@ def signature_from_ast(node: ast.AsyncFunctionDef | ast.FunctionDef, builtin: bo
                 default = default_wrapper.value
 
         parameters.append(inspect.Parameter(name=arg.arg,
-                                            annotation=(get_value(arg.annotation, builtin=builtin)
+                                            annotation=(get_value(arg.annotation, builtin=builtin, symbols=symbols)
                                                         or inspect.Parameter.empty),
                                             kind=inspect.Parameter.KEYWORD_ONLY,
                                             default=default))
@@ -325,7 +606,7 @@ def signature_from_ast(node: ast.AsyncFunctionDef | ast.FunctionDef, builtin: bo
 
     # Handling the Return Annotation
     returned = get_value(node.returns,
-                         builtin=builtin) or inspect.Signature.empty
+                         builtin=builtin, symbols=symbols) or inspect.Signature.empty
 
     return inspect.Signature(parameters=parameters, return_annotation=returned)
 
@@ -348,13 +629,80 @@ def export_node(node: ast.AST) -> typing.Dict[str, typing.Any]:
 NodeType = typing.TypeVar("NodeType", bound=ast.AST)
 
 
+class Lineage(collections.abc.Sequence):
+    """
+    The nesting of an element, as a chain of parent pointers
+
+    Each link only refers to its node and the previous link,
+    the list of nodes being built on first use.
+    """
+
+    __slots__ = ("node", "previous", "depth", "_nodes")
+
+    def __init__(self, node: ast.AST, previous: typing.Optional["Lineage"] = None) -> None:
+        """
+        Parameters
+        ----------
+        node: ast.AST
+            The last node of the nesting
+        previous: Lineage, optional
+            The nesting of `node`
+        """
+        self.node = node
+        self.previous = previous
+        self.depth: int = 1 + (previous.depth if previous is not None else 0)
+        self._nodes: typing.Optional[typing.Tuple[ast.AST, ...]] = None
+
+    @classmethod
+    def of(cls, nodes: typing.Iterable[ast.AST]) -> typing.Optional["Lineage"]:
+        """Creates the chain for the given nodes, None if there is no node"""
+        lineage = None
+        for node in nodes:
+            lineage = cls(node, lineage)
+        return lineage
+
+    @property
+    def nodes(self) -> typing.Tuple[ast.AST, ...]:
+        """The nodes, from the outermost one"""
+        if self._nodes is None:
+            nodes = []
+            current = self
+            while current is not None:
+                nodes.append(current.node)
+                current = current.previous
+            nodes.reverse()
+            self._nodes = tuple(nodes)
+        return self._nodes
+
+    def __getitem__(self, index):
+        if index == -1:
+            return self.node
+        return self.nodes[index]
+
+    def __len__(self) -> int:
+        return self.depth
+
+    def __iter__(self) -> typing.Iterator[ast.AST]:
+        return iter(self.nodes)
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, collections.abc.Sequence) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+
 @dataclasses.dataclass
 class Element(typing.Generic[NodeType]):
     """A documented element"""
     node: NodeType
     """The node"""
-    parents: typing.List[ast.AST] = dataclasses.field(default_factory=list)
-    """The nesting where the element was defined"""
+    parents: typing.Sequence[ast.AST] = dataclasses.field(default_factory=list)
+    """The nesting where the element was defined (a `Lineage` when found by `get_elements`)"""
     docstring: typing.Optional[ast.Constant] = None
     """The docstring element"""
 
@@ -362,34 +710,39 @@ class Element(typing.Generic[NodeType]):
     """The filename where the element was defined, for easier debugging"""
     safe: bool = False
     """If the annotations and exceptions should be safely loaded"""
+    symbols: SymbolTable = dataclasses.field(default_factory=SymbolTable, repr=False, compare=False)
+    """The names defined in the module, to resolve the annotations and exceptions without importing anything"""
 
-    @property
+    _MEMOIZED: typing.ClassVar[typing.Tuple[str, ...]] = ("signature", "raised", "documentation")
+
+    @functools.cached_property
     def signature(self) -> typing.Optional[inspect.Signature]:
-        """If available, the signature of the node"""
+        """If available, the signature of the node, computed on first access"""
         try:
-            return signature_from_ast(self.node, builtin=self.safe)
+            return signature_from_ast(self.node, builtin=self.safe, symbols=self.symbols)
         except Exception:
             return None
 
-    @property
+    @functools.cached_property
     def raised(self):
+        """The exceptions raised by the node, computed on first access"""
         try:
-            return get_raised(self.node, safe=self.safe)
+            return get_raised(self.node, safe=self.safe, symbols=self.symbols)
         except Exception:
             return []
 
     def document(self, **kwargs):
         """Documents the element"""
-        return miko.Documentation(self.docstring.value if self.docstring else "",
-                                  signature=self.signature,
-                                  raised=self.raised,
-                                  filename=self.filename,
-                                  **kwargs)
+        return miko.Documentation.cached(self.docstring.value if self.docstring else "",
+                                         signature=self.signature,
+                                         raised=self.raised,
+                                         filename=self.filename,
+                                         **kwargs)
 
-    @property
+    @functools.cached_property
     def documentation(self):
-        """Returns the documentation for the node"""
-        kwargs = {}
+        """Returns the documentation for the node, parsing its sections on first access"""
+        kwargs = {"lazy": True}
         if isinstance(self.node, ast.ClassDef):
             kwargs["noself"] = True
         elif isinstance(self.node, ast.FunctionDef):
@@ -397,6 +750,15 @@ class Element(typing.Generic[NodeType]):
                 kwargs["noself"] = True
         return self.document(**kwargs)
 
+    def invalidate(self) -> None:
+        """
+        Forgets the signature, the raised exceptions and the documentation of the element
+
+        Note: This should be called after modifying the node or its docstring
+        """
+        for name in self._MEMOIZED:
+            self.__dict__.pop(name, None)
+
     def export(self, indent: int = 4, **kwargs):
         """Exports the data"""
         docs = self.document(**kwargs)
@@ -436,21 +798,50 @@ class ConstantElement(Element[ast.Name | ast.Module]):
 
     def document(self, **kwargs):
         """Documents the element"""
-        return miko.ConstantDocumentation(self.docstring.value
-                                          if self.docstring else "", **kwargs)
+        return miko.ConstantDocumentation.cached(self.docstring.value
+                                                 if self.docstring else "", **kwargs)
 
-    @property
+    @functools.cached_property
     def documentation(self):
-        return self.document()
+        return self.document(lazy=True)
+
+
+_STATEMENTS = (ast.stmt, ast.excepthandler, ast.match_case, Comment)
+"""The nodes found in the statement lists (`body`, `orelse`, `finalbody`, `handlers` and `cases`)"""
+
+
+def _child_statements(node: ast.AST) -> typing.Iterator[ast.AST]:
+    """Returns the child nodes of the given node which are in its statement lists"""
+    if not isinstance(node, _STATEMENTS) and not isinstance(node, ast.Module):
+        # Expressions can't hold any statement
+        return iter(())
+    return (child for child in ast.iter_child_nodes(node) if isinstance(child, _STATEMENTS))
+
+
+class _Frame:
+    """A node being walked through by `get_elements`"""
+    __slots__ = ("node", "lineage", "children", "targets")
+
+    def __init__(self, node: ast.AST, lineage: typing.Optional[Lineage],
+                 children: typing.Iterator[ast.AST]) -> None:
+        self.node = node
+        self.lineage = lineage
+        self.children = children
+        self.targets: typing.List[Element] = []  # This holds the last assignements
 
 
 def get_elements(node: ast.AST,
                  parents: typing.Optional[typing.List[ast.AST]] = None,
                  safe: bool = False,
-                 filename: typing.Optional[str] = None):
+                 filename: typing.Optional[str] = None,
+                 statements_only: bool = False,
+                 allow_import: bool = False):
     """
     Gets all of the elements which could be documented inside the AST
 
+    The tree is walked once, with an explicit stack,
+    each element only keeping a reference to its parent (see `Lineage`)
+
     Parameters
     ----------
     node: ast.AST
@@ -459,54 +850,72 @@ def get_elements(node: ast.AST,
         The parents of the current element
     safe: bool, default = False
         If the annotations and exceptions should be safely loaded
+    statements_only: bool, default = False
+        If only the statement lists should be walked through, skipping the expressions.
+        The documented elements only appear in those, but a string expression
+        right after an assignement (such as a return annotation) isn't considered as its docstring anymore.
+    allow_import: bool, default = False
+        If the modules can be imported to load the annotations and exceptions, when not `safe`.
+        Otherwise, only the builtin ones are loaded, through the imports of the module (see `SymbolTable`).
     """
-    parents = parents or []
-
+    children = _child_statements if statements_only else ast.iter_child_nodes
+    # Without the module, the names are kept as written and only the builtin elements are loaded
+    symbols = SymbolTable(allow_import=allow_import)
+    if not safe and isinstance(node, ast.Module):
+        if filename:
+            module = get_module_name(filename)
+            # The relative imports of a package are resolved from the package itself
+            package = module if pathlib.Path(filename).stem == "__init__" else None
+        else:
+            module, package = "", None
+        symbols = SymbolTable.of(node, module=module, package=package, allow_import=allow_import)
     results: typing.List[Element] = []
-    targets: typing.List[Element] = []  # This holds the last assignements
+    # Filtering out duplicates, by identity
+    seen: typing.Set[int] = set()
 
-    def child_nodes():
-        """The child nodes"""
-        # We are adding the parent node because it is not processed by any parent
-        if not parents:
-            yield node
+    parents = list(parents or [])
+    if len(parents) >= 2 and parents[0] is parents[1]:
+        parents = parents[1:]
 
-        yield from ast.iter_child_nodes(node)
+    if parents:
+        stack = [_Frame(node, Lineage.of(parents), children(node))]
+    else:
+        # We are adding the root node because it is not processed by any parent
+        stack = [_Frame(node, None, iter((node,)))]
+
+    while stack:
+        frame = stack[-1]
+        element = next(frame.children, None)
+        if element is None:
+            stack.pop()
+            continue
 
-    if len(parents) >= 2:
-        if parents[0] == parents[1]:
-            parents = parents[1:]
+        parent = frame.node
+        lineage = frame.lineage
+        if lineage is not None and lineage.node is not parent:
+            lineage = Lineage(parent, lineage)
 
-    for element in child_nodes():
         # If we have a straightforward assignement
         # Example: some_var = some_value or some_var = another_var = some_value
         if isinstance(element, ast.Assign):
-            targets = []
+            frame.targets = []
             for target in element.targets:
                 if isinstance(target, ast.Name):
                     # Add each variable name
                     # `element` is added to the parents to conform with
                     # the `ast.AnnAssign` case
-                    if parents and parents[-1] != node:
-                        adding_parents = parents + [node, element]
-                    else:
-                        adding_parents = parents + [element]
-                    targets.append(ConstantElement(target,
-                                                   parents=adding_parents,
-                                                   safe=safe))
+                    frame.targets.append(ConstantElement(target,
+                                                         parents=Lineage(element, lineage),
+                                                         safe=safe))
 
         # If we have an annotated assignement
         # Example: some_var: some_type = some_value
         if isinstance(element, ast.AnnAssign):
             # We are adding `element` to get to retrieve the
             # annotation when looking into the variable
-            if parents and parents[-1] != node:
-                adding_parents = parents + [node, element]
-            else:
-                adding_parents = parents + [element]
-            targets = [ConstantElement(element.target,
-                                       parents=adding_parents,
-                                       safe=safe)]
+            frame.targets = [ConstantElement(element.target,
+                                             parents=Lineage(element, lineage),
+                                             safe=safe)]
 
         # Constants are inside ast.Expr
         if isinstance(element, ast.Expr):
@@ -514,9 +923,9 @@ def get_elements(node: ast.AST,
 
         # If we have a constant that is a string
         # coming right after `targets` (assignements)
-        if isinstance(element, ast.Constant) and isinstance(element.value, str) and targets:
+        if isinstance(element, ast.Constant) and isinstance(element.value, str) and frame.targets:
             # Then we add this element as the docstring of the assignements
-            for target in targets:
+            for target in frame.targets:
                 target.docstring = element
         elif isinstance(element, (ast.Assign, ast.AnnAssign)):
             # If we are assigning something,
@@ -526,7 +935,7 @@ def get_elements(node: ast.AST,
             # No docstring was found on the assignements
             # Clear the assignements as anything after that
             # is no longer right after
-            targets = []
+            frame.targets = []
 
         if isinstance(element, (ast.AsyncFunctionDef, ast.FunctionDef, ast.ClassDef, ast.Module)):
             # We have a callable
@@ -539,46 +948,35 @@ def get_elements(node: ast.AST,
             else:
                 docstring = None
 
-            # We are adding the callable element
-            if parents and parents[-1] != node:
-                adding_parents = parents + [node]
-            else:
-                adding_parents = parents
-
             adding: typing.List[Element]
 
             if isinstance(element, ast.Module):
-                adding = [ConstantElement(element, parents=adding_parents,
+                adding = [ConstantElement(element, parents=lineage or [],
                                           docstring=docstring,
                                           safe=safe)]
             else:
-                adding = [Element(element, parents=adding_parents,
+                adding = [Element(element, parents=lineage or [],
                                   docstring=docstring,
                                   safe=safe,
-                                  filename=filename)]
+                                  filename=filename,
+                                  symbols=symbols)]
 
         else:
             # Might be another type of element,
             # which should be documented if and only if
             # the element is inside `targets`
-            # adding = targets
-            adding = targets
-
-        # We recursively add the other child elements
-        # and the current element
-        results.extend(adding
-                       + get_elements(element, parents=parents + [node],
-                                      safe=safe, filename=filename))
-
-    # Filtering out duplicates
-    output = []
-    nodes = []
-    for result in results:
-        if result.node in nodes:
-            continue
-        output.append(result)
-        nodes.append(result.node)
-    return output
+            adding = frame.targets
+
+        for result in adding:
+            if id(result.node) not in seen:
+                seen.add(id(result.node))
+                results.append(result)
+
+        # Then the child elements, with the current node as their parent
+        stack.append(_Frame(element, lineage if lineage is not None else Lineage(parent),
+                            children(element)))
+
+    return results
 
 
 def clean_elements(elements: typing.List[Element], indent: int = 4, **kwargs):
@@ -597,16 +995,13 @@ def clean_elements(elements: typing.List[Element], indent: int = 4, **kwargs):
         if not element.docstring:
             continue
 
-        result = element.document(**kwargs).dumps(indent=indent)
-
         padding = " " * element.docstring.col_offset
 
         # We want the right indentation
-        results = []
-        for line in result.splitlines():
-            results.append(padding + line)
-
-        result = "\n".join(results).strip().strip("\n")
+        buffer = io.StringIO()
+        element.document(**kwargs).dump(IndentedWriter(buffer, padding),
+                                        indent=indent)
+        result = buffer.getvalue()
 
         # If this is a multi-line docstring
         # we want to add a newline before
@@ -616,6 +1011,7 @@ def clean_elements(elements: typing.List[Element], indent: int = 4, **kwargs):
 
         if element.docstring:
             element.docstring.value = result
+            element.invalidate()
         elif element.signature and isinstance(element.node, ast.AsyncFunctionDef | ast.FunctionDef):
             new_expr = ast.Expr()
             new_expr.value = ast.Constant()
@@ -625,10 +1021,12 @@ def clean_elements(elements: typing.List[Element], indent: int = 4, **kwargs):
     return elements
 
 
-def clean(source: str, indent: int = 4, safe: bool = False, filename: typing.Optional[str] = None, use_black: bool = False, **kwargs) -> str:
+def clean(source: str, indent: int = 4, safe: bool = False, filename: typing.Optional[str] = None, use_black: bool = False,
+          allow_import: bool = False, **kwargs) -> str:
     """Cleans up the source code"""
     tree = ast.parse(str(source))
-    elements = get_elements(tree, safe=safe, filename=filename)
+    elements = get_elements(tree, safe=safe, filename=filename, statements_only=True,
+                            allow_import=allow_import)
     clean_elements(elements, indent=indent, **kwargs)
     ast.fix_missing_locations(tree)
     # result = ast.unparse(tree)
@@ -640,10 +1038,12 @@ def clean(source: str, indent: int = 4, safe: bool = False, filename: typing.Opt
     return isort.code(result)
 
 
-def info(source: str, indent: int = 4, safe: bool = False, filename: typing.Optional[str] = None, **kwargs) -> typing.List[typing.Dict[str, typing.Any]]:
+def info(source: str, indent: int = 4, safe: bool = False, filename: typing.Optional[str] = None,
+         allow_import: bool = False, **kwargs) -> typing.List[typing.Dict[str, typing.Any]]:
     """Gathers information on the different elements of the source code"""
     tree = ast.parse(str(source))
-    elements = get_elements(tree, safe=safe, filename=filename)
+    elements = get_elements(tree, safe=safe, filename=filename, statements_only=True,
+                            allow_import=allow_import)
     return [
         element.export(indent=indent, **kwargs)
         for element in elements
@@ -988,7 +1388,8 @@ def get_imports(file: pathlib.Path,
     return imports
 
 
-def get_raised(node: ast.AST, safe: bool = True, ignored: typing.Optional[typing.List] = None):
+def get_raised(node: ast.AST, safe: bool = True, ignored: typing.Optional[typing.List] = None,
+               symbols: typing.Optional[SymbolTable] = None):
     ignored = ignored or []
 
     if not hasattr(node, "body"):
@@ -999,9 +1400,9 @@ def get_raised(node: ast.AST, safe: bool = True, ignored: typing.Optional[typing
         if isinstance(element, ast.Raise):
             try:
                 if isinstance(element.exc, ast.Call):
-                    exc = get_value(element.exc.func, builtin=safe)
+                    exc = get_value(element.exc.func, builtin=safe, symbols=symbols)
                 else:
-                    exc = get_value(element.exc, builtin=safe)
+                    exc = get_value(element.exc, builtin=safe, symbols=symbols)
                 if exc and exc not in ignored:
                     results.append(exc)
             except Exception:
@@ -1020,16 +1421,18 @@ def get_raised(node: ast.AST, safe: bool = True, ignored: typing.Optional[typing
         if isinstance(element, ast.Try):
             for handler in element.handlers:
                 # The handlers don't have the try block's ignored
-                results.extend(get_raised(handler, ignored=ignored, safe=safe))
+                results.extend(get_raised(handler, ignored=ignored, safe=safe, symbols=symbols))
 
                 if isinstance(handler.type, ast.Tuple):
                     for element in handler.type.elts:
                         locally_ignored.append(get_value(element,
-                                                         builtin=safe))
+                                                         builtin=safe,
+                                                         symbols=symbols))
                 else:
                     locally_ignored.append(get_value(handler.type,
-                                                     builtin=safe))
+                                                     builtin=safe,
+                                                     symbols=symbols))
         results.extend(get_raised(element,
-                                  ignored=locally_ignored, safe=safe))
+                                  ignored=locally_ignored, safe=safe, symbols=symbols))
 
     return results
@@ -0,0 +1,255 @@
+"""
+Parses the annotations written as strings
+
+Each annotation is parsed once into a small tree of expressions,
+in a single pass over its tokens and without any recursion,
+so that deeply nested annotations (i.e in generated code) are not an issue.
+
+Anything which doesn't look like a type (`list of int`, `array-like`) is kept as a `Literal`.
+
+Example
+-------
+>>> parse("Optional[int | str]")
+Generic(text='Optional[int | str]', base=Name(text='Optional'), arguments=(Union(text='int | str', members=(Name(text='int'), Name(text='str'))),))
+"""
+import dataclasses
+import re
+import typing
+
+from miko.utils.cache import LRUCache
+
+
+@dataclasses.dataclass(frozen=True)
+class Expression:
+    """A parsed annotation"""
+    text: str
+    """The source of the expression"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Name(Expression):
+    """A (dotted) name, like `int` or `typing.Any`"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Literal(Expression):
+    """Anything else, like a string, a number, an ellipsis or some free text"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Generic(Expression):
+    """A subscripted name, like `list[int]`"""
+    base: Name = Name("")
+    """The subscripted name"""
+    arguments: typing.Tuple[Expression, ...] = ()
+    """The expressions between the brackets"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Union(Expression):
+    """Multiple alternatives, like `int | None`"""
+    members: typing.Tuple[Expression, ...] = ()
+    """The alternatives"""
+
+
+@dataclasses.dataclass(frozen=True)
+class List(Expression):
+    """A list of expressions, like the parameters in `Callable[[int, str], bool]`"""
+    items: typing.Tuple[Expression, ...] = ()
+    """The expressions in the list"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Signature(Expression):
+    """A callable written with an arrow, like `(int, str) -> bool`"""
+    arguments: typing.Tuple[Expression, ...] = ()
+    """The parameters types"""
+    returns: Expression = Literal("")
+    """The return type"""
+
+
+_TOKEN = re.compile(r"""
+    (?P<arrow>->)
+    | (?P<literal>\.\.\.|'[^'\\]*(?:\\.[^'\\]*)*'|"[^"\\]*(?:\\.[^"\\]*)*")
+    | (?P<name>[^\W\d]\w*(?:\.[^\W\d]\w*)*)
+    | (?P<open>[\[({])
+    | (?P<close>[\])}])
+    | (?P<separator>[,|])
+    | (?P<other>[^\s\[\](){},|'"]+|\S)
+""", re.VERBOSE)
+
+_NAME = re.compile(r"[^\W\d]\w*(?:\.[^\W\d]\w*)*")
+
+_CLOSERS = {"[": "]", "(": ")"}
+
+
+class _Context:
+    """An expression being parsed, between brackets or parenthesis"""
+    __slots__ = ("kind", "closer", "start", "base", "items", "members")
+
+    def __init__(self, kind: str, closer: typing.Optional[str], start: int,
+                 base: typing.Optional[Name] = None,
+                 items: typing.Optional[typing.List[Expression]] = None) -> None:
+        self.kind = kind
+        self.closer = closer
+        self.start = start
+        self.base = base
+        self.items: typing.List[Expression] = items or []
+        self.members: typing.List[typing.Tuple[Expression, int]] = []
+
+
+Operand = typing.Tuple[Expression, int, int]
+
+
+def _finish(text: str, context: _Context, operand: Operand) -> Operand:
+    """Joins the operand with the previous alternatives of the context"""
+    node, start, end = operand
+    if context.members:
+        start = context.members[0][1]
+        members = tuple(member for member, _ in context.members) + (node,)
+        node = Union(text[start:end], members=members)
+        context.members = []
+    return node, start, end
+
+
+def _skip_phrase(tokens: typing.List[typing.Tuple[str, int, int]], index: int) -> int:
+    """Returns the index of the first token after the free text starting at `index`"""
+    depth = 0
+    while index < len(tokens):
+        kind = tokens[index][0]
+        if kind == "open":
+            depth += 1
+        elif kind == "close":
+            if not depth:
+                break
+            depth -= 1
+        elif kind == "separator" and not depth:
+            break
+        index += 1
+    return index
+
+
+def _parse(text: str) -> Expression:
+    """Parses the given annotation, without caching"""
+    if _NAME.fullmatch(text):
+        # Most annotations are simple names
+        return Name(text)
+    tokens = [(match.lastgroup, match.start(), match.end()) for match in _TOKEN.finditer(text)]
+    fallback = Literal(text)
+    stack = [_Context("top", None, 0)]
+    operand: typing.Optional[Operand] = None
+    index = 0
+    while True:
+        context = stack[-1]
+        kind, start, end = tokens[index] if index < len(tokens) else ("end", len(text), len(text))
+
+        if operand is None:
+            # Expecting an operand
+            if kind == "name":
+                if index + 1 < len(tokens) and text[tokens[index + 1][1]] == "[":
+                    stack.append(_Context("generic", "]", start, base=Name(text[start:end])))
+                    index += 2
+                else:
+                    operand = (Name(text[start:end]), start, end)
+                    index += 1
+            elif kind == "open" and text[start] in _CLOSERS:
+                stack.append(_Context("list" if text[start] == "[" else "paren",
+                                      _CLOSERS[text[start]], start))
+                index += 1
+            elif kind == "close" and text[start] == context.closer and not context.items and not context.members:
+                # Empty brackets, like in `Callable[[], int]`
+                operand = (Literal(""), start, start)
+                context.kind += "-empty"
+            elif kind in ("literal", "other", "open"):
+                # Free text
+                after = _skip_phrase(tokens, index)
+                end = tokens[after - 1][2]
+                operand = (Literal(text[start:end]), start, end)
+                index = after
+            else:
+                # Missing operand, like in `int |`
+                return fallback
+            continue
+
+        # After an operand
+        if kind == "separator" and text[start] == "|":
+            context.members.append(operand[:2])
+            operand = None
+            index += 1
+            continue
+
+        if kind in ("separator", "close", "end") and context.kind == "signature":
+            # The return type ends with the signature
+            returns, _, returns_end = _finish(text, context, operand)
+            stack.pop()
+            operand = (Signature(text[context.start:returns_end],
+                                 arguments=tuple(context.items), returns=returns),
+                       context.start, returns_end)
+            continue
+
+        if kind == "separator":
+            if context.kind == "top":
+                return fallback
+            context.items.append(_finish(text, context, operand)[0])
+            operand = None
+            index += 1
+            continue
+
+        if kind == "close":
+            if text[start] != context.closer:
+                return fallback
+            if context.kind.endswith("-empty"):
+                context.kind = context.kind.rpartition("-")[0]
+            else:
+                context.items.append(_finish(text, context, operand)[0])
+            stack.pop()
+            index += 1
+            items = tuple(context.items)
+            if context.kind == "generic":
+                operand = (Generic(text[context.start:end], base=context.base, arguments=items),
+                           context.start, end)
+            elif context.kind == "list":
+                operand = (List(text[context.start:end], items=items), context.start, end)
+            elif index < len(tokens) and tokens[index][0] == "arrow":
+                stack.append(_Context("signature", None, context.start, items=context.items))
+                operand = None
+                index += 1
+            elif len(items) == 1:
+                # Only grouping
+                operand = (items[0], context.start, end)
+            else:
+                operand = (Literal(text[context.start:end]), context.start, end)
+            continue
+
+        if kind == "end":
+            if len(stack) > 1:
+                return fallback
+            return _finish(text, context, operand)[0]
+
+        # Free text following the operand, like in `list of int`
+        after = _skip_phrase(tokens, index)
+        end = tokens[after - 1][2]
+        operand = (Literal(text[operand[1]:end]), operand[1], end)
+        index = after
+
+
+EXPRESSIONS_CACHE: LRUCache[str, Expression] = LRUCache(maxsize=1024)
+"""The parsed annotations, by text"""
+
+
+def parse(text: str) -> Expression:
+    """
+    Parses the given annotation
+
+    Parameters
+    ----------
+    text: str
+        The annotation
+
+    Returns
+    -------
+    Expression
+        The parsed annotation, a `Literal` with the whole text if it is not a type expression
+    """
+    text = str(text).strip()
+    return EXPRESSIONS_CACHE.get_or_set(text, lambda: _parse(text))
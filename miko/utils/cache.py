@@ -0,0 +1,135 @@
+"""
+Defines the caches used across miko
+"""
+import collections
+import dataclasses
+import threading
+import typing
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheInfo:
+    """Statistics on a cache"""
+    hits: int
+    """The number of lookups which found a value"""
+    misses: int
+    """The number of lookups which did not find a value"""
+    maxsize: int
+    """The maximum number of entries"""
+    currsize: int
+    """The current number of entries"""
+
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class LRUCache(typing.Generic[K, V]):
+    """
+    A thread-safe, size bounded, least recently used cache
+
+    Example
+    -------
+    >>> cache = LRUCache(maxsize=2)
+    >>> cache.get_or_set("a", lambda: 1)
+    1
+    >>> cache.info()
+    CacheInfo(hits=0, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 1024, enabled: bool = True) -> None:
+        """
+        Parameters
+        ----------
+        maxsize: int, default = 1024
+            The maximum number of entries, the least recently used ones being evicted first
+        enabled: bool, default = True
+            If the cache should be used at all
+        """
+        self.maxsize = max(int(maxsize), 0)
+        "The maximum number of entries"
+        self.enabled = bool(enabled)
+        "If the cache is used"
+        self.hits = 0
+        "The number of lookups which found a value"
+        self.misses = 0
+        "The number of lookups which did not find a value"
+        self._entries: "collections.OrderedDict[K, V]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_set(self, key: K, factory: typing.Callable[[], V]) -> V:
+        """
+        Returns the cached value for the given key,
+        computing and storing it with `factory` if missing
+
+        Parameters
+        ----------
+        key: K
+            The key of the value, which needs to be hashable
+        factory: () -> V
+            The function computing the value
+
+        Returns
+        -------
+        V
+        """
+        if not self.enabled:
+            return factory()
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+        # Computed outside of the lock, as this might take a while
+        value = factory()
+        self.put(key, value)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Stores the given value
+
+        Parameters
+        ----------
+        key: K
+        value: V
+        """
+        if not self.enabled or not self.maxsize:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every entry and resets the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Returns statistics on the cache
+
+        Returns
+        -------
+        CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(hits=self.hits, misses=self.misses,
+                             maxsize=self.maxsize, currsize=len(self._entries))
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.info()})"
@@ -1,17 +1,18 @@
 """
 Casts element to the right type
 """
-import ast
 import builtins
 import collections.abc
 import dataclasses
 import json
 import pathlib
+import re
 import subprocess
 import types
 import typing
 
-from miko import static
+from miko.utils import annotations
+from miko.utils.cache import LRUCache
 from miko.utils.empty import is_empty
 
 
@@ -22,33 +23,81 @@ def stringify(t):
     return str(t)
 
 
+_STRING = r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'" + "|" + r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+"""A quoted string, on a single line"""
+_SPECIAL = re.compile(r"""[()\[\]{}'"]""")
+_DEPTH = {"(": (0, 1), ")": (0, -1), "[": (1, 1), "]": (1, -1), "{": (2, 1), "}": (2, -1)}
+_SPLITTERS: typing.Dict[str, typing.Pattern[str]] = {}
+
+
 def split_options(value: str, sep: str = ",") -> typing.List[str]:
-    """Retrieves the different options for an element"""
+    """
+    Retrieves the different options for an element
+
+    The separators inside brackets, parenthesis, braces or quoted strings are ignored.
+
+    Parameters
+    ----------
+    value: str
+        The options
+    sep: str, default = ","
+        The separator between the options
+
+    Returns
+    -------
+    list[str]
+        The stripped options, without the empty ones
+    """
+    if not _SPECIAL.search(value):
+        # Nothing to avoid splitting on
+        return [option for option in (part.strip() for part in value.split(sep)) if option]
+
     results = []
-    current = ""
-    # Avoid splitting on commas inside expressions
-    count_brackets = 0
-    count_parenthesis = 0
-    for letter in value:
-        if letter == "(":
-            count_parenthesis += 1
-        elif letter == ")":
-            count_parenthesis -= 1
-        elif letter == "[":
-            count_brackets += 1
-        elif letter == "]":
-            count_brackets -= 1
-        elif letter == sep and not count_brackets and not count_parenthesis:
-            current = current.strip()
-            if current:
-                # This happens when the first letter is a comma
-                results.append(current)
-            current = ""
-            continue
-        current += letter
-    current = current.strip()
-    if current:
-        results.append(current)
+    if "'" not in value and '"' not in value:
+        # Splitting everywhere, then joining back the parts inside brackets
+        current = []
+        # Only counting the kinds of brackets used
+        pairs = [(opening, closing) for opening, closing in ("()", "[]", "{}")
+                 if opening in value or closing in value]
+        depth = [0] * len(pairs)
+        for part in value.split(sep):
+            current.append(part)
+            for index, (opening, closing) in enumerate(pairs):
+                depth[index] += part.count(opening) - part.count(closing)
+            if not any(depth):
+                option = sep.join(current).strip()
+                if option:
+                    # This happens when the first letter is a comma
+                    results.append(option)
+                current = []
+        option = sep.join(current).strip()
+        if option:
+            results.append(option)
+        return results
+
+    splitter = _SPLITTERS.get(sep, None)
+    if splitter is None:
+        # Only the interesting parts are matched, the rest is skipped by the regex engine
+        splitter = _SPLITTERS.setdefault(sep, re.compile(f"{_STRING}|[()\\[\\]{{}}]|{re.escape(sep)}"))
+
+    start = 0
+    # The number of opened parenthesis, brackets and braces
+    depth = [0, 0, 0]
+    for match in splitter.finditer(value):
+        token = match.group()
+        if token == sep:
+            if not any(depth):
+                option = value[start:match.start()].strip()
+                if option:
+                    results.append(option)
+                start = match.end()
+        elif token in _DEPTH:
+            # Quoted strings don't change the depth
+            kind, change = _DEPTH[token]
+            depth[kind] += change
+    option = value[start:].strip()
+    if option:
+        results.append(option)
     return results
 
 
@@ -74,8 +123,44 @@ class Callable:
 Type = typing.Union[str, type, None, Callable]
 
 
+TYPES_CACHE: LRUCache[typing.Hashable, typing.Tuple[Type, ...]] = LRUCache(maxsize=4096)
+"""
+The types retrieved by `try_retrieve_type`, by annotation
+
+Note: Call `TYPES_CACHE.clear()` in long-running processes if the annotations are not reused
+"""
+
+
 def try_retrieve_type(value: typing.Union[str, type], filename: typing.Optional[str] = None) -> typing.List[Type]:
-    """Tries to retrieve the types from a string"""
+    """
+    Tries to retrieve the types from a string (or a runtime annotation)
+
+    The results are cached in `TYPES_CACHE`,
+    the filename only being used in the error messages
+
+    Parameters
+    ----------
+    value: str | type
+        The annotation
+    filename: str, optional
+        The file where the annotation is defined
+
+    Returns
+    -------
+    list[Type]
+    """
+    try:
+        # `1` and `True` are equal, but shouldn't share the same results
+        key = (type(value), value)
+        hash(key)
+    except TypeError:
+        # Some runtime annotations can't be hashed (i.e with lists in them)
+        return _retrieve_type(value, filename=filename)
+    return list(TYPES_CACHE.get_or_set(key, lambda: tuple(_retrieve_type(value, filename=filename))))
+
+
+def _retrieve_type(value: typing.Union[str, type], filename: typing.Optional[str] = None) -> typing.List[Type]:
+    """Retrieves the types from the given annotation, without caching"""
     filename = filename or "<unknown>"
     if not isinstance(value, str):
         if is_empty(value):
@@ -117,72 +202,132 @@ def try_retrieve_type(value: typing.Union[str, type], filename: typing.Optional[
         # print(type(value), value, typing.get_origin(value))
         return [typing.get_origin(value) or value]
 
-    # processing = str(value).strip().lower()  # List => list
-    processing = str(value).strip()  # list    => list
-    processing = processing.removeprefix("typing.")  # typing.list => list
-
-    # If we have a Union type
-    if "|" in processing:
-        results = []
-        for value in split_options(processing, sep="|"):
-            try:
-                results.extend(try_retrieve_type(value, filename=filename))
-            except RecursionError:
-                # For some reason, this happens sometimes ?
-                continue
-        return results
-
-    processing_lower = processing.lower()
-    if processing.count("[") == processing.count("]"):  # list[dict[str, int]] => list
-        # If we have a typing.Union type
-        if processing_lower.startswith("union") or processing_lower.startswith("optional"):
-            inside, _, _ = processing.partition("[")[2].rpartition("]")
-            results = []
-            for val in split_options(inside):
-                results.append(val)
-            if processing_lower.startswith("optional"):
-                results.append(None)
-            return results
-
-        # If we have a generic type, we don't really care about what's inside
-        processing, _, _ = processing.partition("[")
-        processing_lower = processing.lower()
-    else:
+    processing = str(value).strip()
+    if processing.count("[") != processing.count("]"):
         raise SyntaxError(f"The number of brackets don't match in: `{value}` "
                           f"(file: {filename})")
+    return _resolve(annotations.parse(processing))
 
-    # We assume that there is only 1 type to return from now on
-
-    if "->" in processing:
-        parsed = ast.parse(processing, mode="func_type", filename=filename)
-        results = []
-        results.append(Callable(
-            arg_types=tuple([tuple(try_retrieve_type(static.get_value(arg), filename=filename))
-                       for arg in parsed.argtypes]),
-            return_type=tuple(try_retrieve_type(static.get_value(parsed.returns),
-                                                filename=filename))
-        ))
-        return results
 
+_MISSING = object()
+
+
+def _resolve_name(name: str) -> typing.Any:
+    """Returns the type with the given name, or `_MISSING`"""
+    name = name.removeprefix("typing.")  # typing.list => list
+    lower = name.lower()
     # Handling None types
-    if processing_lower == "none":
-        return [None]
+    if lower == "none":
+        return None
+    if lower == "path" or lower == "pathlib.path":
+        return pathlib.Path
+    if lower == "popen" or lower == "subprocess.popen":
+        return subprocess.Popen
+    # If the given element is global (list, str, int, ...) return it
+    return getattr(builtins, name, _MISSING)
+
+
+def _generic_kind(expression: annotations.Generic) -> str:
+    """Returns the lowercased name of the generic, without the `typing` prefix"""
+    return expression.base.text.removeprefix("typing.").lower()
+
+
+def _dependencies(expression: annotations.Expression) -> typing.Tuple[annotations.Expression, ...]:
+    """Returns the expressions needed to retrieve the types of the given one"""
+    if isinstance(expression, annotations.Union):
+        return expression.members
+    if isinstance(expression, annotations.Signature):
+        return expression.arguments + (expression.returns,)
+    if isinstance(expression, annotations.Generic):
+        kind = _generic_kind(expression)
+        if kind in ("union", "optional"):
+            return expression.arguments
+        if kind in ("callable", "collections.abc.callable") and len(expression.arguments) == 2:
+            parameters, returns = expression.arguments
+            if isinstance(parameters, annotations.List):
+                return parameters.items + (returns,)
+            return (parameters, returns)
+    return ()
+
+
+def _resolve(expression: annotations.Expression) -> typing.List[Type]:
+    """
+    Retrieves the types from the given parsed annotation
+
+    Note: This walks the expression with an explicit stack
+    """
+    if isinstance(expression, annotations.Name):
+        result = _resolve_name(expression.text)
+        return [expression.text] if result is _MISSING else [result]
+    resolved: typing.Dict[int, typing.List[Type]] = {}
+    stack = [(expression, False)]
+    while stack:
+        current, ready = stack.pop()
+        dependencies = _dependencies(current)
+        if dependencies and not ready:
+            stack.append((current, True))
+            stack.extend((dependency, False) for dependency in dependencies)
+            continue
 
-    if processing_lower == "path" or processing_lower == "pathlib.path":
-        return [pathlib.Path]
+        results = [resolved[id(dependency)] for dependency in dependencies]
+        if isinstance(current, annotations.Signature) or (isinstance(current, annotations.Generic)
+                                                          and results
+                                                          and _generic_kind(current) not in ("union", "optional")):
+            resolved[id(current)] = [Callable(arg_types=tuple(tuple(result) for result in results[:-1]),
+                                              return_type=tuple(results[-1]))]
+        elif dependencies:
+            # Union[...], Optional[...] or `|`
+            resolved[id(current)] = [element for result in results for element in result]
+            if isinstance(current, annotations.Generic) and _generic_kind(current) == "optional":
+                resolved[id(current)].append(None)
+        else:
+            name = current.base.text if isinstance(current, annotations.Generic) else current.text
+            result = _MISSING
+            if isinstance(current, (annotations.Name, annotations.Generic)):
+                # If we have a generic type, we don't really care about what's inside
+                result = _resolve_name(name)
+            # We failed to do anything with the type, return it as a string
+            # This might happen for example when you provide dot path elements (translatepy.Language)
+            resolved[id(current)] = [current.text] if result is _MISSING else [result]
+    return resolved[id(expression)]
+
+
+_JSON_NUMBER = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+_JSON_STRING = re.compile(r'"[^"\\\x00-\x1f]*"')
+"""A JSON string without any escape sequence"""
+_JSON_CONSTANTS = {"true": True, "false": False, "null": None,
+                   "NaN": float("nan"), "Infinity": float("inf"), "-Infinity": float("-inf")}
+
+_INTEGER = re.compile(r"[+-]?\d+(?:_\d+)*")
+_FLOAT = re.compile(r"[+-]?(?:[\d_.]+(?:e[+-]?[\d_]+)?|inf|infinity|nan)", re.IGNORECASE)
+_GUARDS: typing.Dict[typing.Any, typing.Callable[[str], typing.Any]] = {
+    int: _INTEGER.fullmatch,
+    float: _FLOAT.fullmatch
+}
+"""
+Quick checks for the values which can't be casted to the given type
+
+Note: They should never reject a value the type would accept
+"""
 
-    if processing_lower == "popen" or processing_lower == "subprocess.popen":
-        return [subprocess.Popen]
+CastPlan = typing.Tuple[typing.Tuple[typing.Optional[typing.Callable[[str], typing.Any]],
+                                     typing.Callable[[str], typing.Any]], ...]
+CAST_PLANS: LRUCache[typing.Hashable, CastPlan] = LRUCache(maxsize=256)
+"""The cast plans computed by `try_cast`, by set of types"""
 
-    try:
-        # If the given element is global (list, str, int, ...) return it
-        return [getattr(builtins, processing)]
-    except AttributeError:
-        pass
 
-    # We failed to do anything with the type, return it as a string
-    # This might happen for example when you provide dot path elements (translatepy.Language)
-    return [str(value)]
+def _cast_plan(types: typing.Iterable[typing.Union[str, None, type]]) -> CastPlan:
+    """
+    Returns the (guard, cast) pairs to try for the given types, in order
+
+    Parameters
+    ----------
+    types: Iterable[str | None | type]
+    """
+    return tuple((_GUARDS.get(cast, None), cast) for cast in types
+                 # The strings (unresolved types) and None can't be called,
+                 # and `NoneType` can't be called with a value
+                 if cast and callable(cast) and not isinstance(cast, str) and cast is not type(None))
 
 
 def try_cast(value: str,
@@ -201,21 +346,37 @@ def try_cast(value: str,
 
     # If the provided value is pretty simple,
     # JSON should be able to decode it (A simple list or dictionary for example)
-    try:
-        return json.loads(value)
-    except Exception:
-        pass
+    number = _JSON_NUMBER.fullmatch(value)
+    if number:
+        return float(value) if number.group(1) or number.group(2) else int(value)
+    if value in _JSON_CONSTANTS:
+        return _JSON_CONSTANTS[value]
+    if _JSON_STRING.fullmatch(value):
+        return value[1:-1]
+    if value.startswith(("[", "{", '"')):
+        # Any other JSON value starts with one of these
+        try:
+            return json.loads(value)
+        except Exception:
+            pass
 
     if value == "None":
         return None
 
     # If the value is not simple (A complex number for example)
-    for cast in types:
+    try:
+        key = types if isinstance(types, frozenset) else frozenset(types)
+        plan = CAST_PLANS.get_or_set(key, lambda: _cast_plan(types))
+    except TypeError:
+        # Some types can't be hashed
+        plan = _cast_plan(types)
+    for guard, cast in plan:
+        if guard is not None and not guard(value):
+            continue
         try:
-            if cast and not isinstance(cast, str):
-                return cast(value)
+            return cast(value)
         except Exception:
             continue
 
     # If failed to do anything, return it as a string at least
-    return str(value)
+    return value
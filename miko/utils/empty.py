@@ -6,15 +6,55 @@ import typing
 
 
 class Empty:
-    """Represents an empty element"""
-
-
-def is_empty(value: typing.Any):
-    """Internal function to determine if the given value
-    is considered as 'Empty' by the inspect module"""
-    value_repr = str(value).strip().replace(" ", "")
-    return ((value is inspect._empty)
-            or (isinstance(value, inspect._empty))
-            or (value_repr == "<class'inspect._empty'>")
-            or (value is Empty)
-            or (isinstance(value, Empty)))
+    """
+    Represents an empty element
+
+    Note: There is only one instance, `EMPTY`, which calling `Empty()` returns
+    """
+
+    __slots__ = ()
+
+    _instance: typing.Optional["Empty"] = None
+
+    def __new__(cls) -> "Empty":
+        if Empty._instance is None:
+            Empty._instance = super().__new__(cls)
+        return Empty._instance
+
+    def __reduce__(self) -> str:
+        return "EMPTY"
+
+    def __repr__(self) -> str:
+        return "EMPTY"
+
+
+EMPTY = Empty()
+"""The canonical empty value"""
+
+_INSPECT_EMPTY_REPR = "<class'inspect._empty'>"
+
+
+def is_empty(value: typing.Any) -> bool:
+    """
+    Internal function to determine if the given value
+    is considered as 'Empty' by miko or the inspect module
+
+    Note: This only relies on identity and type checks,
+    the given value is never converted to a string
+
+    Parameters
+    ----------
+    value: Any
+
+    Returns
+    -------
+    bool
+    """
+    if value is EMPTY or value is inspect.Parameter.empty or value is Empty:
+        return True
+    if isinstance(value, (Empty, inspect.Parameter.empty)):
+        return True
+    if type(value) is str:
+        # An annotation which was turned into a string
+        return value.strip().replace(" ", "") == _INSPECT_EMPTY_REPR
+    return False
@@ -0,0 +1,110 @@
+"""
+Defines the text stream wrappers used to dump the documentations
+"""
+import typing
+
+
+class Writable(typing.Protocol):
+    """Anything with a `write` method, like a text file or `io.StringIO`"""
+
+    def write(self, text: str) -> typing.Any:
+        ...
+
+
+class StrippedWriter:
+    """
+    Writes to the given stream as if the whole text was stripped (see `str.strip`),
+    without buffering it
+
+    Only the trailing whitespaces are held back, until some other content comes.
+
+    Example
+    -------
+    >>> stream = io.StringIO()
+    >>> writer = StrippedWriter(stream)
+    >>> _ = writer.write("\\n  Hello")
+    >>> _ = writer.write(" \\n\\n")
+    >>> stream.getvalue()
+    'Hello'
+    """
+
+    def __init__(self, fp: Writable, prefix: str = "") -> None:
+        """
+        Parameters
+        ----------
+        fp: Writable
+            The stream to write to
+        prefix: str, default = ""
+            A text written right before the first non-whitespace character
+        """
+        self.fp = fp
+        "The underlying stream"
+        self.prefix = str(prefix)
+        "A text written right before the first non-whitespace character"
+        self.written = False
+        "If any non-whitespace character was written"
+        self._pending = ""
+
+    def write(self, text: str) -> int:
+        """
+        Writes the given text
+
+        Parameters
+        ----------
+        text: str
+
+        Returns
+        -------
+        int
+            The length of the given text
+        """
+        length = len(text)
+        if not self.written:
+            text = text.lstrip()
+            if not text:
+                return length
+            self.written = True
+            if self.prefix:
+                self.fp.write(self.prefix)
+        content = self._pending + text if self._pending else text
+        stripped = content.rstrip()
+        if stripped:
+            self.fp.write(stripped)
+            self._pending = content[len(stripped):]
+        else:
+            self._pending = content
+        return length
+
+
+class IndentedWriter:
+    """Writes to the given stream, indenting every line but the first one"""
+
+    def __init__(self, fp: Writable, padding: str) -> None:
+        """
+        Parameters
+        ----------
+        fp: Writable
+            The stream to write to
+        padding: str
+            The text added at the start of every new line
+        """
+        self.fp = fp
+        "The underlying stream"
+        self.padding = str(padding)
+        "The text added at the start of every new line"
+
+    def write(self, text: str) -> int:
+        """
+        Writes the given text
+
+        Parameters
+        ----------
+        text: str
+
+        Returns
+        -------
+        int
+            The length of the given text
+        """
+        self.fp.write(text.replace("\n", "\n" + self.padding))
+        return len(text)
@@ -0,0 +1,82 @@
+import typing
+
+from miko.utils import caster
+
+
+def test_types_cache():
+    print("[test] Testing the types cache")
+    caster.TYPES_CACHE.clear()
+    assert caster.try_retrieve_type("int | None", filename="a.py") == [int, None]
+    misses = caster.TYPES_CACHE.info().misses
+    assert caster.try_retrieve_type("int | None", filename="b.py") == [int, None]
+    info = caster.TYPES_CACHE.info()
+    assert info.misses == misses and info.hits >= 1
+
+    # The results are copies
+    caster.try_retrieve_type("int | None").append(str)
+    assert caster.try_retrieve_type("int | None") == [int, None]
+
+    # Runtime annotations, hashable or not
+    assert caster.try_retrieve_type(typing.Optional[int]) == [int, type(None)]
+    assert caster.try_retrieve_type(typing.Callable[[int], str])[0].return_type == (str,)
+    caster.TYPES_CACHE.clear()
+    assert len(caster.TYPES_CACHE) == 0
+
+
+def test_annotations():
+    print("[test] Testing the annotations parser")
+    from miko.utils import annotations
+
+    expression = annotations.parse("Callable[[int, str], bool] | None")
+    assert isinstance(expression, annotations.Union)
+    assert isinstance(expression.members[0], annotations.Generic)
+    assert annotations.parse("list of int") == annotations.Literal("list of int")
+
+    assert caster.try_retrieve_type("list[int | str]") == [list]
+    assert caster.try_retrieve_type("Optional[dict]") == [dict, None]
+    assert caster.try_retrieve_type("(list[int]) -> str | None") == [caster.Callable(arg_types=((list,),),
+                                                                                     return_type=(str, None))]
+    assert caster.try_retrieve_type("int or str") == ["int or str"]
+
+    # Deeply nested annotations don't recurse
+    depth = 5000
+    assert caster.try_retrieve_type("Optional[" * depth + "int" + "]" * depth) == [int] + [None] * depth
+
+
+def test_split_options():
+    print("[test] Testing caster.split_options")
+    assert caster.split_options(", int,  optional,") == ["int", "optional"]
+    assert caster.split_options("Dict[str, int] | None, default = (1, 2)") == ["Dict[str, int] | None",
+                                                                               "default = (1, 2)"]
+    assert caster.split_options("default = {'a': 1, 'b': 2}, optional") == ["default = {'a': 1, 'b': 2}", "optional"]
+    assert caster.split_options('str, default = "a, b"') == ["str", 'default = "a, b"']
+    assert caster.split_options("list[int | str] | None", sep="|") == ["list[int | str]", "None"]
+
+
+def test_try_cast():
+    print("[test] Testing caster.try_cast")
+    assert caster.try_cast("1", {str}) == 1
+    assert caster.try_cast("1.5e2", set()) == 150.0
+    assert caster.try_cast("null", set()) is None and caster.try_cast("None", set()) is None
+    assert caster.try_cast('"a, b"', set()) == "a, b"
+    assert caster.try_cast("[1, {\"a\": true}]", set()) == [1, {"a": True}]
+    assert caster.try_cast("1.2j", {int, float, complex}) == 1.2j
+    assert caster.try_cast("1_000", {int}) == 1000
+    assert caster.try_cast("MyEnum.A", {"MyEnum", type(None)}) == "MyEnum.A"
+    assert caster.try_cast("abc", frozenset({int, float})) == "abc"
+    assert frozenset({int, float}) in caster.CAST_PLANS
+
+
+def test_is_empty():
+    print("[test] Testing utils.empty.is_empty")
+    import inspect
+
+    from miko.utils.empty import EMPTY, Empty, is_empty
+
+    class Expensive:
+        def __repr__(self):
+            raise AssertionError("is_empty should not convert values to strings")
+
+    assert Empty() is EMPTY and is_empty(EMPTY) and is_empty(Empty)
+    assert is_empty(inspect.Parameter.empty) and is_empty("<class 'inspect._empty'>")
+    assert not is_empty(Expensive()) and not is_empty(None) and not is_empty("")
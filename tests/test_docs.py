@@ -1,3 +1,8 @@
+import copy
+import inspect
+import pickle
+import typing
+
 from . import data
 from miko import Docs
 
@@ -6,3 +11,248 @@ def test_docs():
     print("[test] Testing miko.Docs")
     docs = Docs(data.func.__doc__)
     assert docs.description
+
+
+def test_sections():
+    print("[test] Testing miko.Documentation.sections")
+    from miko import Documentation, ConstantDocumentation, parsers
+
+    assert Documentation.sections.blocks["PARAMETERS"] == "parameters"
+    assert Documentation.sections.inline["NOTE"] == "notes"
+    assert Documentation.sections.flags["DEPRECATED"] == "deprecated"
+    assert "parameters" not in ConstantDocumentation.sections.parsers
+    try:
+        Documentation.sections.blocks["PARAMETERS"] = "other"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("The section table should be immutable")
+
+    class Extended(Documentation):
+        todo: parsers.notes.Notes
+
+    assert Extended.sections.parsers["todo"] is parsers.notes.Notes
+    assert "parameters" in Extended.sections.parsers
+    assert Documentation.sections is not Extended.sections
+
+
+def test_lazy():
+    print("[test] Testing lazy miko.Docs")
+    eager = Docs(data.func.__doc__)
+    lazy = Docs(data.func.__doc__, lazy=True)
+    assert lazy.description == eager.description
+    assert "parameters" not in vars(lazy)
+    assert lazy.parameters.exported == eager.parameters.exported
+    assert "parameters" in vars(lazy) and "returns" not in vars(lazy)
+    assert lazy.dumps() == eager.dumps()
+
+    # The copies load their sections on their own
+    lazy = Docs(data.func.__doc__, lazy=True)
+    copied = copy.copy(lazy)
+    assert copied.parameters.exported == eager.parameters.exported
+    assert "parameters" not in vars(lazy)
+    assert lazy.parameters.exported == eager.parameters.exported
+
+
+def test_cache():
+    print("[test] Testing miko.Docs.cached")
+    from miko.miko import DOCUMENTATION_CACHE
+
+    DOCUMENTATION_CACHE.enabled = True
+    DOCUMENTATION_CACHE.clear()
+    try:
+        first = Docs.cached(data.func.__doc__, noself=True)
+        assert Docs.cached(data.func.__doc__, noself=True) is first
+        assert Docs.cached(data.func.__doc__, noself=False) is not first
+        info = DOCUMENTATION_CACHE.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+        # The shared documentations can't be modified
+        name = first.parameters.elements[0].name
+        for modify in (lambda: first.parameters[name].extend_options(["str"]),
+                       lambda: first.parameters.__setitem__(name, first.parameters.new_element("other")),
+                       lambda: first.parameters.merge_signature(inspect.Signature()),
+                       lambda: first.parameters.pop(),
+                       lambda: first.notes.append("note"),
+                       lambda: setattr(first, "description", "")):
+            try:
+                modify()
+            except TypeError:
+                pass
+            else:
+                raise AssertionError("The cached documentation was modified")
+        assert pickle.loads(pickle.dumps(first)).dumps() == first.dumps()
+    finally:
+        DOCUMENTATION_CACHE.clear()
+        DOCUMENTATION_CACHE.enabled = False
+    assert Docs.cached(data.func.__doc__) is not Docs.cached(data.func.__doc__)
+
+
+def test_parse_many():
+    print("[test] Testing miko.Docs.parse_many")
+    docstrings = [data.func.__doc__, data.func_bad.__doc__, "", "Hello"]
+    expected = [Docs(docstring).dumps() for docstring in docstrings]
+    for executor in ("serial", "thread", "process"):
+        results = Docs.parse_many(docstrings, workers=2, executor=executor)
+        assert [docs.dumps() for docs in results] == expected
+
+    # The docstrings are only read as the results are consumed
+    read = []
+
+    def endless():
+        while True:
+            read.append(True)
+            yield f"Docstring {len(read)}"
+
+    results = Docs.parse_many(endless(), workers=2, chunksize=3, executor="thread")
+    assert not read
+    assert [next(results).description for _ in range(5)] == [f"Docstring {i}" for i in range(1, 6)]
+    # Two chunks per worker in advance, and one more for each of the two chunks consumed
+    assert len(read) <= (2 * 2 + 2) * 3
+    results.close()
+
+
+def test_elements():
+    print("[test] Testing the parsed elements")
+    docs = Docs(data.func.__doc__, filename="data.py")
+    first, second = docs.parameters.elements[:2]
+    assert not hasattr(first, "__dict__")
+    assert first.extra_arguments is second.extra_arguments
+    assert first.extra_arguments is docs.parameters.extra_arguments
+
+
+def test_map_index():
+    print("[test] Testing the parsers name index")
+    from miko.parsers.map import MapParser
+
+    parser = MapParser()
+    parser.extend("\n".join(f"a{i}: opt{i}" for i in range(500)) + "\na1: other\n  body")
+    assert len(parser) == 500
+    assert parser["a1"].options == {"opt1", "other"}
+    assert "a499" in parser and "a500" not in parser
+
+    # The index follows the modifications made through the parser
+    parser.insert(0, parser.new_element("a1"))
+    assert parser["a1"] is parser.elements[0]
+    del parser["a1"]
+    assert parser["a1"].options == {"opt1", "other"}
+    parser["a2"] = parser.new_element("renamed")
+    assert parser["a2"] is parser.elements[2]
+    assert parser.pop(0).name == "a0"
+    parser.append(parser.new_element("c"))
+    assert "c" in parser and "a0" not in parser
+    assert parser["a3"] is parser.elements[2]
+    parser.remove(parser["a3"])
+    assert parser["a4"] is parser.elements[2]
+    parser.reverse()
+    assert parser["c"] is parser.elements[0]
+
+    # And the direct modifications of the elements list
+    parser.elements.insert(0, parser.new_element("a1"))
+    assert parser["a1"] is parser.elements[0]
+    parser.elements[0].name = "d"
+    assert parser["a1"] is not parser.elements[0] and parser["a1"].name == "a1"
+    parser.elements[0], parser.elements[1] = parser.elements[1], parser.elements[0]
+    assert parser["d"] is parser.elements[1]
+
+    parser = MapParser()
+    parser.extend("a: x\nb: y")
+    parser.pop(0)
+    parser.append(parser.new_element("c"))
+    assert "c" in parser and "a" not in parser
+
+    # Renaming the elements
+    parser = MapParser()
+    parser.extend("a: x\nb: y")
+    parser["c"] = parser["a"]
+    assert [element.name for element in parser] == ["c", "b"]
+    parser["b"] = parser["c"]
+    assert [element.name for element in parser] == ["b"] and parser["b"].options == {"x"}
+    parser.append(parser.new_element("d"))
+    parser.elements[0].name = "z"
+    assert "z" in parser and "b" not in parser
+    parser.elements[1] = parser.new_element("w")
+    assert "w" in parser and "d" not in parser
+
+
+def test_parameter_fields():
+    print("[test] Testing the cached parameter fields")
+    docs = Docs("Parameters\n----------\na: int, optional\n    hello")
+    parameter = docs.parameters["a"]
+    parameter.types.add(str)
+    assert parameter.types == {int}
+    assert parameter.optional and not parameter.deprecated
+    parameter.extend_options(["deprecated", "default = 2"])
+    assert parameter.deprecated
+    assert parameter.default == 2
+    docs.parameters["a"] = docs.parameters.new_element("b", options=["str"])
+    assert docs.parameters["a"].types == {str}
+    assert not docs.parameters["a"].optional
+
+
+def test_dump():
+    print("[test] Testing miko.Docs.dump")
+    import io
+
+    docs = Docs(data.func.__doc__)
+    stream = io.StringIO()
+    docs.dump(stream, indent=2)
+    assert stream.getvalue() == docs.dumps(indent=2)
+    assert stream.getvalue() == stream.getvalue().strip()
+    assert "Parameters\n----------\na: bool\n  this is the first argument" in stream.getvalue()
+
+
+def test_merge_signature():
+    print("[test] Testing Parameters.merge_signature")
+    import inspect
+
+    def func(a: int, b: typing.Optional[str] = None, *args, c: float = 1.5, **kwargs):
+        pass
+
+    docs = Docs("Parameters\n----------\nb: str\n    the b\nd: bool\n    not in the signature",
+                signature=inspect.signature(func))
+    assert [element.name for element in docs.parameters] == ["a", "b", "args", "c", "kwargs", "d"]
+    assert docs.parameters["b"].types == {str, type(None)}
+    assert docs.parameters["c"].default == 1.5
+
+    # Merging again only adds what is missing
+    docs.parameters.merge_signature(inspect.signature(func))
+    assert len(docs.parameters) == 6
+    assert docs.parameters["d"].types == {bool}
+
+
+def test_copyright():
+    print("[test] Testing the copyright options")
+    import pickle
+
+    docs = Docs("Copyright\n---------\nMe: MIT, from = 2020, to = 2022\n    author\nYou: year = 2021\nThem: GPL, year = soon")
+    me, you, them = docs.copyright
+    assert (me.license, me.year_from, me.year_to) == ("MIT", 2020, 2022)
+    assert (you.license, you.year_from, you.year_to) == (None, 2021, 2021)
+    assert (them.license, them.year_from) == ("GPL", None)
+    assert me.values == {"from": "2020", "to": "2022"}
+    assert dict(them.values) == {"year": "soon"}
+    try:
+        me.values["from"] = "2019"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("The values are read-only")
+    assert pickle.loads(pickle.dumps(me)).year_to == 2022
+    you.extend_options(["to = 2023"])
+    assert (you.year_from, you.year_to) == (2021, 2023)
+    assert you.render_options() == "from = 2021, to = 2023"
+
+
+def test_parser_get():
+    print("[test] Testing Parser.get")
+
+    docs = Docs(data.func.__doc__)
+    assert docs.parameters.get("a") is docs.parameters["a"] is docs.parameters.a
+    assert docs.parameters.get("unknown") is None
+    assert not hasattr(docs.parameters, "unknown")
+    assert not hasattr(docs.parameters, "__deepcopy_hook__")
+    assert docs.notes.get(0) == docs.notes.elements[0] and docs.notes.get(10, "default") == "default"
+    assert docs.notes.elements[0] in docs.notes and 0 not in docs.notes
+    assert "a" in docs.parameters and "unknown" not in docs.parameters
+    assert copy.copy(docs.parameters).get("a") is docs.parameters["a"]
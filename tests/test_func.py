@@ -8,3 +8,21 @@ def test_func():
     b = Function(data.func_bad)
     c = Function(data.func_with_some_sections)
     d = Function(data.func_without_docs)
+
+
+def test_func_of():
+    print("[test] Testing miko.Function.of")
+    import gc
+
+    a = Function.of(data.func)
+    assert a.docs is Function.of(data.func).docs
+    assert a.source.name == "func" and a.source_code.startswith("def func")
+
+    def temporary(x: int):
+        """Hello"""
+
+    assert Function.of(temporary).signature is Function.of(temporary).signature
+    count = len(Function._instances)
+    del temporary
+    gc.collect()
+    assert len(Function._instances) == count - 1
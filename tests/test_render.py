@@ -0,0 +1,17 @@
+from miko import Docs
+from miko.markdown import render
+
+
+def test_parameters():
+    print("[test] Testing miko.markdown.render.parameters")
+    docs = Docs("Parameters\n----------\n"
+                "a: int, default = 0\n"
+                "b: NoneType, default = None\n"
+                "c: str, optional\n"
+                "d: str\n")
+    rendered = render.parameters(docs.parameters)
+    # The falsy defaults are rendered as well
+    assert "Default Value: `0`" in rendered
+    assert "Default Value: `None`" in rendered
+    assert "This value is **optional**" in rendered
+    assert rendered.count("Default Value") == 2
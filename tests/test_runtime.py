@@ -0,0 +1,35 @@
+from . import data
+import miko
+
+
+def test_walk():
+    print("[test] Testing miko.walk")
+    records = list(miko.walk(data))
+    paths = [record.path for record in records]
+    assert paths[0] == "tests.data"
+    assert len(paths) == len(set(paths))
+    func = records[paths.index("tests.data.func")]
+    assert func.kind == "function"
+    assert func.documentation.parameters["b"].default == 1.2
+
+
+def test_module():
+    print("[test] Testing miko.Module")
+    module = miko.Module(miko)
+    record = module["miko.miko.Callable.of"]
+    assert record.kind == "method"
+    assert "miko.miko.Documentation" in module
+    # The records are memoized
+    assert list(module)[0] is list(module)[0]
+    assert sum(1 for record in module if record.path == "miko.miko.Callable") == 1
+
+
+def test_methods_parameters():
+    print("[test] Testing the parameters of the properties and class methods records")
+    module = miko.Module(miko)
+    prop = module["miko.miko.Callable.is_method"]
+    assert prop.kind == "property"
+    assert "self" not in prop.documentation.parameters
+    method = module["miko.miko.Callable.of"]
+    assert list(method.signature.parameters) == ["func"]
+    assert [parameter.name for parameter in method.documentation.parameters] == ["func"]
@@ -0,0 +1,191 @@
+import pathlib
+import sys
+
+from miko import static
+import ast_comments as ast
+
+SOURCE = '''
+"""module"""
+
+CONSTANT = 1
+"""constant"""
+
+
+class A:
+    """class"""
+
+    attribute: int = 2
+    """attribute"""
+
+    def method(self):
+        """method"""
+        def inner():
+            pass
+'''
+
+
+def test_get_elements():
+    print("[test] Testing static.get_elements")
+    tree = ast.parse(SOURCE)
+    elements = static.get_elements(tree)
+    names = [getattr(element.node, "name", getattr(element.node, "id", None)) for element in elements]
+    assert names == [None, "CONSTANT", "A", "attribute", "method", "inner"]
+    assert [element.docstring.value if element.docstring else None
+            for element in elements] == ["module", "constant", "class", "attribute", "method", None]
+    inner = elements[-1]
+    assert list(inner.parents) == [tree, tree.body[3], tree.body[3].body[3]]
+    assert inner.parents[-1] is elements[-2].node
+    assert elements[0].parents == []
+
+
+def test_get_elements_deep():
+    print("[test] Testing static.get_elements on deep trees")
+    tree = ast.parse("x = " + " + ".join(["1"] * 500) + '\n"""doc"""')
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(200)
+    try:
+        elements = static.get_elements(tree)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert elements[1].docstring.value == "doc"
+
+
+def test_get_elements_statements_only():
+    print("[test] Testing static.get_elements when only walking through the statements")
+
+    def signature(elements):
+        return [(type(element.node).__name__, len(element.parents),
+                 element.docstring.value if element.docstring else None) for element in elements]
+
+    tree = ast.parse(SOURCE)
+    assert signature(static.get_elements(tree, statements_only=True)) == signature(static.get_elements(tree))
+    assert list(static._child_statements(ast.parse("x = [i for i in range(10)]").body[0])) == []
+
+
+def test_element_memoization():
+    print("[test] Testing the memoization of static.Element")
+    tree = ast.parse(SOURCE)
+    method = static.get_elements(tree)[4]
+    assert method.signature is method.signature
+    assert method.documentation is method.documentation
+    assert method.documentation.description == "method"
+
+    method.docstring.value = "changed"
+    assert method.documentation.description == "method"
+    method.invalidate()
+    assert method.documentation.description == "changed"
+
+
+def test_get_element_cache():
+    print("[test] Testing the cache of static.get_element")
+    static.ELEMENTS_CACHE.clear()
+    assert static.get_element("pathlib.Path", builtin=True) is static.get_element("pathlib.Path", builtin=True)
+    errors = []
+    for _ in range(2):
+        try:
+            static.get_element("some_module.some_var")
+        except ValueError as err:
+            errors.append(err)
+        else:
+            raise AssertionError("some_module.some_var should not be found")
+    info = static.ELEMENTS_CACHE.info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+    # A new exception is raised each time
+    assert errors[0] is not errors[1] and errors[0].args == errors[1].args
+
+    sys.modules["some_module"] = type(sys)("some_module")
+    sys.modules["some_module"].some_var = 1
+    try:
+        assert static.get_element("some_module.some_var") == 1
+        # Replacing a module by another, keeping the same number of modules
+        del sys.modules["some_module"]
+        sys.modules["other_module"] = type(sys)("other_module")
+        sys.modules["other_module"].some_var = 2
+        assert static.get_element("other_module.some_var") == 2
+        try:
+            static.get_element("some_module.some_var")
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("some_module was removed")
+    finally:
+        sys.modules.pop("some_module", None)
+        sys.modules.pop("other_module", None)
+
+
+def test_symbol_table(tmp_path, monkeypatch):
+    print("[test] Testing static.SymbolTable")
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "types.py").write_text("class Thing:\n    pass\n")
+    (package / "module.py").write_text('''
+import pathlib
+from translatepy import Language
+from .types import Thing
+try:
+    from fast import Parser
+except ImportError:
+    Parser = None
+
+
+class Local:
+    pass
+
+
+Alias = Language
+
+
+def function(a: Language, b: Thing, c: Local, d: Alias, e: pathlib.Path, f: Parser):
+    """function"""
+    raise Language.Error()
+''')
+    assert static.get_module_name(package / "module.py") == "package.module"
+    assert static.get_module_name(package / "__init__.py") == "package"
+
+    tree = ast.parse((package / "module.py").read_text())
+    symbols = static.SymbolTable.of(tree, module="package.module")
+    assert symbols.resolve("Language.english") == "translatepy.Language.english"
+    assert symbols.resolve("Thing") == "package.types.Thing"
+    assert symbols.resolve("Alias") == "translatepy.Language"
+    assert symbols.resolve("Parser") == "fast.Parser"
+    assert symbols.resolve("Unknown") == "Unknown"
+
+    # Only the values naming something are aliases
+    values = static.SymbolTable.of(ast.parse('join = "".join\nvalue = get().value\nfirst = items[0].value\n'),
+                                   module="package.values")
+    assert values.resolve("join") == "package.values.join"
+    assert values.resolve("value") == "package.values.value"
+    assert values.resolve("first") == "package.values.first"
+    assert static.info('import string\njoin = "".join\nvalue = string.capwords("a").upper\n')
+
+    def function(**kwargs):
+        elements = static.get_elements(tree, filename=str(package / "module.py"), **kwargs)
+        return [element for element in elements if getattr(element.node, "name", None) == "function"][0]
+
+    element = function()
+    annotations = [parameter.annotation for parameter in element.signature.parameters.values()]
+    # The names which are not loaded are kept as written
+    assert annotations == ["Language", "Thing", "Local", "Alias", pathlib.Path, "Parser"]
+    assert element.raised == ["Language.Error"]
+    assert "package" not in sys.modules
+
+    cleaned = static.clean('from package.types import Thing\n\n\n'
+                           'def function(a: Thing):\n    """\n    Parameters\n    ----------\n    a: Thing\n    """\n',
+                           filename=str(package / "module.py"))
+    assert "a: Thing\n" in cleaned and "package.types.Thing" not in cleaned
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Without the module, nothing is imported either
+    node = ast.parse("def other(a: package.types.Thing, b: pathlib.Path):\n    pass\n").body[0]
+    for element in (static.get_elements(node)[0], static.Element(node)):
+        assert element.signature.parameters["a"].annotation == "package.types.Thing"
+        assert element.signature.parameters["b"].annotation is pathlib.Path
+    assert "package" not in sys.modules
+    try:
+        element = function(allow_import=True)
+        assert element.signature.parameters["b"].annotation.__name__ == "Thing"
+    finally:
+        sys.modules.pop("package.types", None)
+        sys.modules.pop("package", None)
+    assert function(safe=True).signature.parameters["b"].annotation == "Thing"
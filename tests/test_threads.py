@@ -0,0 +1,35 @@
+import concurrent.futures
+
+from . import data
+from miko import Docs, Function, parsers
+
+
+def test_threads():
+    print("[test] Testing miko.Docs from multiple threads")
+    functions = [data.func, data.func_bad, data.func_with_some_sections,
+                 data.func_without_docs, data.func_with_bracket_annotations]
+    expected = [Function(func).docs.dumps() for func in functions]
+    names = parsers.parameters.Parameters.names
+
+    def parse(index: int):
+        func = functions[index % len(functions)]
+        docs = Docs(func.__doc__, signature=Function(func).signature, lazy=bool(index % 2))
+        return index, docs.dumps()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as pool:
+        for index, result in pool.map(parse, range(2000)):
+            assert result == expected[index % len(functions)]
+
+    assert parsers.parameters.Parameters.names is names
+    assert parsers.notes.Notes("Remark").names[-1] == "Remark"
+    assert "Remark" not in parsers.notes.Notes.names
+
+
+def test_shared_lazy():
+    print("[test] Testing a lazy miko.Docs shared between threads")
+    for _ in range(50):
+        docs = Docs(data.func.__doc__, lazy=True)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: docs.parameters, range(8)))
+        assert all(result is results[0] for result in results)
+        assert len(results[0]) == 5
@@ -0,0 +1,23 @@
+import inspect
+
+from . import data
+from miko import Docs
+from miko.parsers import tokenizer
+
+
+def test_tokenizer():
+    print("[test] Testing miko.parsers.tokenizer")
+    tokens = list(tokenizer.tokenize("Hello\n\n! DEPRECATED\n\nNote: world\n\nReturns\n-------\nint\n    value"))
+    assert isinstance(tokens[0], tokenizer.Description)
+    assert isinstance(tokens[1], tokenizer.Flag) and tokens[1].name == " DEPRECATED"
+    assert isinstance(tokens[2], tokenizer.Inline) and tokens[2].content == "world"
+    assert isinstance(tokens[3], tokenizer.Section)
+    assert tokens[3].name == "Returns" and tokens[3].content == ("int", "    value")
+
+
+def test_large_docstring():
+    print("[test] Testing miko.Docs on a large docstring")
+    entries = "\n".join(f"arg{index}: int\n    argument {index}" for index in range(1000))
+    docs = Docs(f"Description\n\nParameters\n----------\n{entries}\n\n" + inspect.cleandoc(data.func.__doc__))
+    assert len(docs.parameters) == 1005
+    assert docs.parameters["arg999"].body == "argument 999"